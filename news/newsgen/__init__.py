@@ -0,0 +1,2 @@
+# Haber Robotu üretim hattı. Ağır bağımlılıklar (feedparser, requests) yalnızca
+# ilgili fonksiyonlar çağrıldığında yüklenir; paketi import etmek yan etkisizdir.
@@ -0,0 +1,172 @@
+import re
+from collections import defaultdict
+
+from .categories import (
+    CATEGORY_DISPLAY_MAP,
+    FALLBACK_CATEGORIES,
+    INTL_CATEGORY_KEYWORDS,
+    POSSIBLE_IMPACTS,
+    TR_CATEGORY_KEYWORDS,
+    WHY_IMPORTANT_REASONS,
+)
+from .sources import FOREIGN_SOURCES, SOURCE_SUBCATEGORY_MAP
+
+def determine_origin(source):
+    if source in FOREIGN_SOURCES:
+        return "yabanci"
+    return "turkiye"
+    
+def stable_pick(text, options):
+    if not text or not options:
+        return None
+    index = sum(ord(c) for c in text) % len(options)
+    return options[index]
+
+def slugify_category(label: str) -> str:
+    if not label:
+        return ""
+
+    replacements = {
+        "ç": "c", "ğ": "g", "ı": "i", "ö": "o", "ş": "s", "ü": "u",
+        "Ç": "c", "Ğ": "g", "İ": "i", "Ö": "o", "Ş": "s", "Ü": "u"
+    }
+
+    for k, v in replacements.items():
+        label = label.replace(k, v)
+
+    label = label.lower()
+    label = label.replace("/", " ")
+    label = re.sub(r"\s+", "_", label)
+
+    return label.strip("_")
+
+# Türkçe eklemeli bir dil: "maçı", "belediyesinde", "tbmm'de" gibi çekimli halleri yakala.
+# Ek listesi açık tutulur; "kazandı" (kaza+ndı), "verildi" (veri+ldi) gibi fiiller eşleşmez.
+# Ünlü uyumu gevşek: kök + yapım eki + çoğul + iyelik / hal eki + -ki
+TR_SUFFIX = (
+    r"['’]?"
+    r"(?:[cç][ıiuü]|l[ıiuü]|s[ıiuü]z)?"                   # golcü, zamlı, savunmasız
+    r"(?:l[ae]r)?"                                      # maçlar
+    r"(?:(?:s?[ıiuü]|l[ae]r[ıi])"                       # belediyesi, takımları
+    r"(?:n(?:[ıiuüae]|[dt][ae]n?|[ıiuü]n)|y?l[ae])?"    # belediyesinde, belediyesinin
+    r"|y?[ıiuüae]|n?[ıiuü]n|[dt][ae]n?|y?l[ae])?"       # ligi, kazaya, abd'nin, ilde, maçla
+    r"(?:k[iü])?"                                       # ildeki
+)
+# Ek kuralıyla anahtar kelimeye benzeyen yaygın kelimeler (il+e, ai+le, iha+le, kar+a ...)
+TR_SUFFIX_COLLISIONS = ("ile", "aile", "ihale", "kara", "kare", "karı", "karın")
+
+# İngilizce: çoğul, iyelik ve düzenli fiil ekleri ("missiles", "markets", "nato's", "attacked")
+INTL_SUFFIX = r"(?:['’]s|s|es|ed|ing)?"
+INTL_SUFFIX_COLLISIONS = ("cares", "cared", "caring", "wares", "eves", "who's")
+
+def keyword_trie_pattern(keywords):
+    # Ortak önekleri birleştirerek tek bir regex alternation üret
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def render(node):
+        # Uzun dallar önce denenir; eşleşme sağda tutmazsa regex kısa anahtara geri döner
+        branches = [
+            re.escape(ch) + render(child)
+            for ch, child in sorted(node.items())
+            if ch != ""
+        ]
+        if "" in node:
+            branches.append("")
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return render(trie)
+
+def compile_keyword_classifier(keyword_map, suffix="", collisions=()):
+    # keyword -> kategoriler (aynı kelime birden çok kategoride olabilir)
+    keyword_categories = defaultdict(list)
+    for cat, keywords in keyword_map.items():
+        for keyword in keywords:
+            keyword = keyword.lower()
+            if cat not in keyword_categories[keyword]:
+                keyword_categories[keyword].append(cat)
+
+    # Anahtar kelime (+ izin verilen ekler) iki yandan da kelime sınırında bitmeli:
+    # "ai" "said" içinde, "un" "under" içinde eşleşmez
+    exclude = ""
+    if collisions:
+        exclude = "(?!(?:" + "|".join(map(re.escape, collisions)) + r")(?!\w))"
+    pattern = (
+        r"(?<!\w)" + exclude
+        + "(" + keyword_trie_pattern(keyword_categories) + ")"
+        + (f"(?:{suffix})" if suffix else "") + r"(?!\w)"
+    )
+
+    return {
+        "pattern": re.compile(pattern),
+        "keyword_categories": dict(keyword_categories),
+        "order": {cat: i for i, cat in enumerate(keyword_map)}
+    }
+
+TR_CLASSIFIER = compile_keyword_classifier(
+    TR_CATEGORY_KEYWORDS, suffix=TR_SUFFIX, collisions=TR_SUFFIX_COLLISIONS
+)
+INTL_CLASSIFIER = compile_keyword_classifier(
+    INTL_CATEGORY_KEYWORDS, suffix=INTL_SUFFIX, collisions=INTL_SUFFIX_COLLISIONS
+)
+
+def category_scores(text, classifier):
+    # Tek geçişte tüm keyword eşleşmelerini bul, kategori başına say
+    scores = defaultdict(int)
+    keyword_categories = classifier["keyword_categories"]
+    for match in classifier["pattern"].finditer(text):
+        for cat in keyword_categories[match.group(1)]:
+            scores[cat] += 1
+    return dict(scores)
+
+def best_category(scores, classifier):
+    if not scores:
+        return None
+    # En yüksek skor; eşitlikte keyword tablosundaki sıra geçerli
+    order = classifier["order"]
+    return min(scores, key=lambda cat: (-scores[cat], order[cat]))
+
+def determine_subcategory(source, origin, title, summary):
+    # 1️⃣ Kaynak bazlı override (en güçlü kural)
+    if source in SOURCE_SUBCATEGORY_MAP:
+        return SOURCE_SUBCATEGORY_MAP[source]
+
+    # 2️⃣ Keyword bazlı sınıflandırma
+    # Not: bu yol eski first-match taramasından yavaş (bench_classifier.py'de ~0.5x);
+    # bedeli kategori başına skor + kelime sınırı/ek doğruluğu. Şu an RSS_FEEDS'teki
+    # 28 kaynağın hepsi SOURCE_SUBCATEGORY_MAP'te, yani bu yol soğuk — yalnızca
+    # haritada olmayan yeni bir kaynak eklenince çalışır.
+    text = f"{title} {summary}".lower()
+    classifier = TR_CLASSIFIER if origin == "turkiye" else INTL_CLASSIFIER
+    cat = best_category(category_scores(text, classifier), classifier)
+    if cat:
+        return CATEGORY_DISPLAY_MAP.get(cat, CATEGORY_DISPLAY_MAP.get(cat.lower(), cat))
+
+    # 3️⃣ Fallback
+    return stable_pick(title, sorted(FALLBACK_CATEGORIES))
+
+def is_local_news(origin, category):
+    return origin == "turkiye" and category.strip().lower() == "yerel"
+
+def build_why_important(category):
+    # Her haberde aynı cümle çıkmasın diye döndürme
+    options = WHY_IMPORTANT_REASONS.get(category)
+    if options:
+        pick = stable_pick(category, options)
+        return [pick] if pick else [options[0]]
+
+    return ["Kamuoyunu ilgilendiren önemli bir gelişme olması"]
+
+def build_possible_impacts(category):
+    options = POSSIBLE_IMPACTS.get(category)
+    if options:
+        pick = stable_pick(category, options)
+        return [pick] if pick else [options[0]]
+        
+    return ["Olası etkiler zamanla netleşebilir."]
@@ -0,0 +1,172 @@
+import heapq
+import importlib.util
+import random
+import signal
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import httpclient, runstats
+from .fetch import FEED_ENTRY_LIMIT, fetch_all_feeds, load_feed_state, save_feed_state
+from .health import RUN_BUDGET, load_health, record_results, save_health, select_feeds
+from .incremental import load_previous_articles, load_seen_index
+from .pipeline import OUTPUT, RUN_HISTORY_FILE, RUN_STATS_FILE, save_outputs, update_articles
+from .sources import RSS_FEEDS
+from .translate import save_translation_cache, shared_translation_cache
+
+# 🔁 Sürekli çalışma modu: her feed kendi yayın hızına göre yoklanır
+MIN_INTERVAL = 120          # Bir feed en sık bu kadar saniyede bir yoklanır
+MAX_INTERVAL = 3600         # Sessiz feed'ler en seyrek bu kadar saniyede bir
+START_INTERVAL = 600        # Yayın hızı henüz ölçülmemiş feed'ler için
+TARGET_NEW_PER_POLL = 5     # Her yoklamada hedeflenen yeni girdi sayısı
+RATE_SMOOTHING = 0.3        # Yayın hızı ortalamasında son ölçümün ağırlığı
+MAX_BACKOFF = 6 * 3600      # Hata veren feed için en uzun bekleme
+BATCH_WINDOW = 30           # Bu kadar saniye içinde sırası gelecek feed'ler aynı turda yoklanır
+BUILD_LATEST = Path(__file__).resolve().parents[2] / "scripts" / "build_latest.py"
+
+def new_schedule(feeds):
+    # url -> yoklama durumu; ilk turda hepsi hemen yoklanır
+    return {
+        url: {
+            "source": source,
+            "url": url,
+            "order": i,
+            "interval": START_INTERVAL,
+            "rate": None,
+            "failures": 0,
+            "last_poll": None,
+            "next_at": 0.0,
+        }
+        for i, (source, url) in enumerate(feeds)
+    }
+
+def next_delay(entry, ok, new_items, now):
+    # Başarılı yoklamada aralık yayın hızına göre, hatada üstel geri çekilme
+    if not ok:
+        entry["failures"] += 1
+        delay = min(MAX_BACKOFF, entry["interval"] * 2 ** entry["failures"])
+        return delay * random.uniform(0.8, 1.2)
+
+    entry["failures"] = 0
+    if entry["last_poll"] is None:
+        # İlk yoklamadaki girdiler birikmiş pencere; hız ölçümü değil
+        return entry["interval"]
+
+    elapsed = max(now - entry["last_poll"], 1.0)
+    observed = new_items / elapsed
+    if entry["rate"] is None:
+        entry["rate"] = observed
+    else:
+        entry["rate"] = RATE_SMOOTHING * observed + (1 - RATE_SMOOTHING) * entry["rate"]
+
+    if new_items >= FEED_ENTRY_LIMIT:
+        # Feed penceresinin tamamı yenilenmiş: aradaki girdiler kaçmış olabilir
+        interval = elapsed / 2
+    elif entry["rate"] > 0:
+        interval = TARGET_NEW_PER_POLL / entry["rate"]
+    else:
+        interval = entry["interval"] * 1.5
+
+    entry["interval"] = min(MAX_INTERVAL, max(MIN_INTERVAL, interval))
+    return entry["interval"]
+
+def load_build_latest():
+    # scripts/build_latest.py paket değil; bir kez yükleyip main()'ini tekrar kullan
+    spec = importlib.util.spec_from_file_location("build_latest", BUILD_LATEST)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def poll(due, state):
+    # Sırası gelen feed'leri indir, bellekteki haberleri güncelle, değiştiyse yaz
+    runstats.reset()
+    now = datetime.now(timezone.utc)
+
+    feeds, _ = select_feeds([(e["source"], e["url"]) for e in due], state["health"])
+    with runstats.timer("fetch"):
+        fetched = fetch_all_feeds(feeds, state["feed_state"], deadline=time.monotonic() + RUN_BUDGET)
+
+    articles, digests, fresh_keys = update_articles(
+        fetched, state["feed_state"], state["seen_index"], state["articles"], state["cache"], now
+    )
+    record_results(state["health"], fetched)
+    save_health(state["health"])
+
+    current = {a["entry_key"]: a for a in articles}
+    # Önceki haberler yerinde güncellenir: sonradan çevrilenler de yazılmayı gerektirir
+    retranslated = runstats.snapshot()["counters"].get("translate.retried", 0)
+    if fresh_keys or retranslated or current.keys() != state["articles"].keys():
+        state["seen_index"], generated_at = save_outputs(
+            articles, digests, state["seen_index"], state["feed_state"]
+        )
+        save_translation_cache(state["cache"])
+        with runstats.timer("build_latest"):
+            state["build_latest"].main(state["build_argv"])
+        runstats.incr("articles.fresh", len(fresh_keys))
+        runstats.incr("articles.output", len(articles))
+        runstats.write_report(
+            RUN_STATS_FILE, RUN_HISTORY_FILE,
+            generated_at=generated_at, mode="daemon", polled=len(due),
+            http=httpclient.record_connection_stats()
+        )
+    else:
+        save_feed_state(state["feed_state"])
+    state["articles"] = current
+
+    feeds = runstats.snapshot()["feeds"]
+    return {
+        e["url"]: (
+            feeds.get(e["source"], {}).get("status") != "error",
+            feeds.get(e["source"], {}).get("built", 0)
+        )
+        for e in due
+    }
+
+def run_daemon(feeds=None, stop=None, build_argv=()):
+    feeds = feeds or RSS_FEEDS
+    stop = stop or threading.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, lambda *_: stop.set())
+
+    state = {
+        "feed_state": load_feed_state(),
+        "health": load_health(),
+        "seen_index": load_seen_index(),
+        "articles": load_previous_articles(OUTPUT),
+        "cache": shared_translation_cache(),
+        "build_latest": load_build_latest(),
+        "build_argv": list(build_argv),
+    }
+    schedule = new_schedule(feeds)
+    queue = [(e["next_at"], e["order"], url) for url, e in schedule.items()]
+    heapq.heapify(queue)
+    print(f"[daemon] {len(schedule)} feed, en sık {MIN_INTERVAL}s / en seyrek {MAX_INTERVAL}s")
+
+    while queue and not stop.wait(max(0.0, queue[0][0] - time.monotonic())):
+        horizon = time.monotonic() + BATCH_WINDOW
+        due = []
+        while queue and queue[0][0] <= horizon:
+            due.append(schedule[heapq.heappop(queue)[2]])
+
+        try:
+            outcomes = poll(due, state)
+        except Exception as exc:
+            # Beklenmeyen hata süreci düşürmesin: bu turdaki feed'ler hata sayılır
+            print(f"[daemon] tur başarısız: {type(exc).__name__}: {exc}")
+            outcomes = {e["url"]: (False, 0) for e in due}
+
+        now = time.monotonic()
+        for entry in due:
+            ok, new_items = outcomes[entry["url"]]
+            delay = next_delay(entry, ok, new_items, now)
+            entry["last_poll"] = now
+            entry["next_at"] = now + delay
+            heapq.heappush(queue, (entry["next_at"], entry["order"], entry["url"]))
+            print(
+                f"[daemon] {entry['source']:<24} +{new_items:<3} "
+                f"{'OK ' if ok else 'HATA'} sonraki {delay / 60:5.1f} dk"
+            )
+
+    state["cache"].close()
+    print("[daemon] durduruldu")
@@ -0,0 +1,125 @@
+import random
+import re
+import zlib
+from collections import defaultdict
+from itertools import combinations
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+# 🔁 Tekrarlanan haber tespiti (MinHash + LSH)
+DEDUP_NUM_PERM = 32         # MinHash imza uzunluğu
+DEDUP_BANDS = 8             # LSH band sayısı (band başına 4 satır)
+DEDUP_THRESHOLD = 0.6       # Tahmini Jaccard benzerliği eşiği
+DEDUP_SHINGLE_SIZE = 3      # Kelime shingle uzunluğu
+
+TRACKING_PARAMS = {"fbclid", "gclid", "ref", "cmp", "ito", "at_medium", "at_campaign"}
+
+_minhash_masks = [random.Random(i).getrandbits(32) for i in range(DEDUP_NUM_PERM)]
+
+def normalize_url(url):
+    if not url:
+        return ""
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parsed.query)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    ))
+    path = parsed.path.rstrip("/") or "/"
+    return f"{host}{path}" + (f"?{query}" if query else "")
+
+def shingles(text):
+    tokens = re.findall(r"\w+", text.lower())
+    if len(tokens) < DEDUP_SHINGLE_SIZE:
+        return {zlib.crc32(t.encode("utf-8")) for t in tokens}
+    return {
+        zlib.crc32(" ".join(tokens[i:i + DEDUP_SHINGLE_SIZE]).encode("utf-8"))
+        for i in range(len(tokens) - DEDUP_SHINGLE_SIZE + 1)
+    }
+
+def minhash(shingle_set):
+    if not shingle_set:
+        return None
+    return tuple(min(map(mask.__xor__, shingle_set)) for mask in _minhash_masks)
+
+def minhash_similarity(a, b):
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+def find_duplicate_clusters(articles):
+    # Union-find: aynı URL veya benzer metin -> aynı küme
+    parent = list(range(len(articles)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    # 1️⃣ Normalize edilmiş URL indeksi
+    by_url = {}
+    for i, article in enumerate(articles):
+        key = normalize_url(article.get("url"))
+        if not key:
+            continue
+        if key in by_url:
+            union(by_url[key], i)
+        else:
+            by_url[key] = i
+
+    # 2️⃣ MinHash imzaları, LSH band'leri ile aday çiftler (tüm çiftler değil)
+    signatures = [
+        minhash(shingles(f"{a.get('title', '')} {a.get('summary', '')}"))
+        for a in articles
+    ]
+    rows = DEDUP_NUM_PERM // DEDUP_BANDS
+    buckets = defaultdict(list)
+    for i, signature in enumerate(signatures):
+        if signature is None:
+            continue
+        for band in range(DEDUP_BANDS):
+            buckets[(band, signature[band * rows:(band + 1) * rows])].append(i)
+
+    # Bucket içindeki her çift karşılaştırılır (bucket'lar küçük); yalnızca ilk üyeyle
+    # karşılaştırmak sonucu ekleme sırasına bağlardı
+    checked = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for pair in combinations(members, 2):
+            if pair in checked:
+                continue
+            checked.add(pair)
+            i, j = pair
+            if minhash_similarity(signatures[i], signatures[j]) >= DEDUP_THRESHOLD:
+                union(i, j)
+
+    clusters = defaultdict(list)
+    for i in range(len(articles)):
+        clusters[find(i)].append(i)
+    return [members for _, members in sorted(clusters.items())]
+
+def dedupe_articles(articles):
+    # Her kümeden ilk haberi tut, diğer kaynakları "sources" altında sakla
+    result = []
+    for members in find_duplicate_clusters(articles):
+        primary = articles[members[0]]
+        sources = {}
+        for i in members:
+            member = articles[i]
+            for src in member.get("sources") or [{
+                "source": member["source"],
+                "url": member["url"],
+                "entry_key": member.get("entry_key")
+            }]:
+                sources.setdefault(src["entry_key"] or src["url"], src)
+        primary["sources"] = list(sources.values())
+        result.append(primary)
+
+    print(f"[dedup] {len(articles)} haber -> {len(result)} küme")
+    return result
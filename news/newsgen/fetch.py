@@ -0,0 +1,182 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from urllib.parse import urlparse
+
+from . import httpclient, runstats
+from .jsonstream import atomic_write_text
+
+# ⏱️ Paralel feed indirme ayarları
+FETCH_WORKERS = 8       # Aynı anda en fazla kaç feed indirilir
+PER_HOST_LIMIT = 2      # Aynı host'a aynı anda en fazla kaç istek
+FEED_TIMEOUT = 15       # Tek feed için saniye (bağlantı + okuma)
+RUN_DEADLINE = 120      # Tüm indirme aşaması için toplam süre (saniye)
+FEED_ENTRY_LIMIT = 25   # Feed başına işlenen en fazla girdi
+
+_host_semaphores = defaultdict(lambda: threading.Semaphore(PER_HOST_LIMIT))
+_host_semaphores_lock = threading.Lock()
+
+def host_semaphore(url):
+    host = urlparse(url).netloc.lower()
+    with _host_semaphores_lock:
+        return _host_semaphores[host]
+
+FEED_STATE_FILE = Path("news/feed_state.json")
+
+# Feed girdilerinden saklanan alanlar (304 gelince tekrar kullanılır)
+ENTRY_FIELDS = (
+    "id", "title", "summary", "description", "link",
+    "published_parsed", "media_content", "media_thumbnail", "enclosures"
+)
+
+def load_feed_state():
+    if FEED_STATE_FILE.exists():
+        try:
+            return json.loads(FEED_STATE_FILE.read_text(encoding="utf-8"))
+        except ValueError:
+            return {}
+    return {}
+
+def save_feed_state(state):
+    atomic_write_text(FEED_STATE_FILE, json.dumps(state, ensure_ascii=False))
+
+def snapshot_entry(entry):
+    snap = {}
+    for key in ENTRY_FIELDS:
+        value = entry.get(key)
+        if value is None:
+            continue
+        if key == "published_parsed":
+            value = list(value)
+        elif isinstance(value, list):
+            value = [dict(v) for v in value if isinstance(v, dict)]
+        snap[key] = value
+    return snap
+
+def restore_entry(snap):
+    import feedparser
+
+    entry = feedparser.FeedParserDict(snap)
+    if snap.get("published_parsed"):
+        entry["published_parsed"] = time.struct_time(snap["published_parsed"])
+    return entry
+
+def conditional_headers(feed_state):
+    # User-Agent ve Accept-Encoding ortak oturumdan gelir
+    headers = {}
+    if not feed_state:
+        return headers
+    if feed_state.get("etag"):
+        headers["If-None-Match"] = feed_state["etag"]
+    if feed_state.get("last_modified"):
+        headers["If-Modified-Since"] = feed_state["last_modified"]
+    return headers
+
+DEADLINE_ERROR = "TimeoutError: run deadline exceeded"
+
+def fetch_feed(source, url, deadline, feed_state=None, requested=None):
+    # requested: istek gönderilen URL'ler (deadline'da hâlâ bekleyen feed'i ayırt etmek için)
+    started = time.monotonic()
+    result = {
+        "source": source,
+        "url": url,
+        "body": None,
+        "not_modified": False,
+        "etag": None,
+        "last_modified": None,
+        "error": None,
+        "deadline_skipped": False
+    }
+
+    try:
+        with host_semaphore(url):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # Aynı host'taki yavaş feed'in arkasında sıra beklerken süre doldu: feed'in hatası değil
+                result["deadline_skipped"] = True
+                raise TimeoutError("run deadline exceeded")
+            if requested is not None:
+                requested.add(url)
+            res = httpclient.get(
+                url,
+                headers=conditional_headers(feed_state),
+                timeout=min(FEED_TIMEOUT, remaining),
+                deadline=deadline
+            )
+            if res.status_code == 304 and feed_state:
+                result["not_modified"] = True
+            else:
+                res.raise_for_status()
+                result["body"] = res.content
+                result["etag"] = res.headers.get("ETag")
+                result["last_modified"] = res.headers.get("Last-Modified")
+    except Exception as exc:
+        result["error"] = f"{type(exc).__name__}: {exc}"
+
+    result["elapsed"] = time.monotonic() - started
+    return result
+
+def fetch_all_feeds(feeds, state=None, deadline=None):
+    # Tüm feed'leri paralel indir, sonuçları RSS_FEEDS sırasıyla döndür
+    # deadline: çalışmanın genel süre bütçesinden kalan (monotonic); RUN_DEADLINE'ı kısaltabilir
+    state = state or {}
+    started = time.monotonic()
+    deadline = min(started + RUN_DEADLINE, deadline or float("inf"))
+
+    executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    requested = set()
+    futures = [
+        executor.submit(fetch_feed, source, url, deadline, state.get(url), requested)
+        for source, url in feeds
+    ]
+    wait(futures, timeout=max(0.0, deadline - started))
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    results = []
+    for (source, url), future in zip(feeds, futures):
+        if future.done() and not future.cancelled():
+            result = future.result()
+        else:
+            # İsteği hiç gönderilmemiş (kuyrukta / host sırasında) feed sağlık kaydında hata sayılmaz
+            result = {
+                "source": source,
+                "url": url,
+                "body": None,
+                "not_modified": False,
+                "error": DEADLINE_ERROR,
+                "deadline_skipped": url not in requested,
+                "elapsed": time.monotonic() - started
+            }
+        results.append(result)
+
+        if result["not_modified"]:
+            status = "304 (değişmedi)"
+        elif result["body"] is not None:
+            status = "OK"
+        elif result["deadline_skipped"]:
+            status = "süre doldu, istek gönderilmedi"
+        else:
+            status = result["error"]
+        print(f"[fetch] {source:<24} {result['elapsed']:6.2f}s  {status}")
+        if result["not_modified"]:
+            outcome = "not_modified"
+        elif result["body"] is not None:
+            outcome = "ok"
+        elif result["deadline_skipped"]:
+            outcome = "deadline_skipped"
+        else:
+            outcome = "error"
+        runstats.feed(
+            source,
+            fetch_seconds=result["elapsed"],
+            status=outcome,
+            bytes=len(result["body"]) if result["body"] is not None else 0,
+            error=result["error"]
+        )
+        runstats.incr(f"fetch.{'ok' if outcome == 'not_modified' else outcome}")
+
+    print(f"[fetch] toplam {len(feeds)} feed, {time.monotonic() - started:.2f}s")
+    return results
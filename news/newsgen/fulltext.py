@@ -0,0 +1,183 @@
+import importlib.util
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+from . import httpclient, runstats
+from .fetch import host_semaphore
+from .text import build_long_summary
+
+# 📰 Opsiyonel tam metin: haber sayfası indirilir, readability ile ana metin çıkarılır
+FULLTEXT = os.environ.get("FULLTEXT") == "1"
+FULLTEXT_WORKERS = 6            # Aynı anda indirilen / işlenen sayfa
+FULLTEXT_TIMEOUT = 15           # Tek sayfa için saniye
+FULLTEXT_DEADLINE = 60          # Aşamanın toplam süresi; yetişmeyen haber RSS özetiyle kalır
+FULLTEXT_MAX_BYTES = 3_000_000  # Daha büyük sayfalar işlenmez
+FULLTEXT_SUMMARY_CHARS = 1500   # long_summary için tam metinden alınan en fazla karakter
+
+FULLTEXT_CACHE_FILE = Path("news/fulltext_cache.sqlite3")
+FULLTEXT_CACHE_MAX_AGE_DAYS = 7
+
+class FullTextCache:
+    # URL -> (ETag, Last-Modified, çıkarılan metin); yazmalar flush() ile tek transaction
+    def __init__(self, path=FULLTEXT_CACHE_FILE):
+        path.parent.mkdir(exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "text TEXT NOT NULL, used_at INTEGER NOT NULL)"
+        )
+        self.pending = {}
+
+    def get(self, url):
+        if url in self.pending:
+            return self.pending[url]
+        row = self.conn.execute(
+            "SELECT etag, last_modified, text FROM pages WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {"etag": row[0], "last_modified": row[1], "text": row[2]}
+
+    def put(self, url, page):
+        self.pending[url] = page
+
+    def flush(self):
+        now = int(time.time())
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO pages (url, etag, last_modified, text, used_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (url, p["etag"], p["last_modified"], p["text"], now)
+                    for url, p in self.pending.items()
+                ]
+            )
+        self.pending.clear()
+
+    def evict(self, max_age_days=FULLTEXT_CACHE_MAX_AGE_DAYS):
+        cutoff = int(time.time()) - max_age_days * 86400
+        with self.conn:
+            self.conn.execute("DELETE FROM pages WHERE used_at < ?", (cutoff,))
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+_shared_cache = None
+
+def shared_fulltext_cache():
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = FullTextCache()
+    return _shared_cache
+
+def extract_text(html, url=None):
+    # readability ana içeriği seçer; paragraflar boş satırla ayrılır
+    import lxml.html
+    from readability import Document
+
+    content = Document(html, url=url).summary(html_partial=True)
+    tree = lxml.html.fromstring(content)
+    paragraphs = [" ".join(p.text_content().split()) for p in tree.iter("p")]
+    text = "\n\n".join(p for p in paragraphs if p)
+    return text or " ".join(tree.text_content().split())
+
+def fetch_page(url, cached, deadline):
+    # Cache'te ETag / Last-Modified varsa koşullu istek; 304'te cache'teki metin
+    headers = {}
+    if cached and cached["etag"]:
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached["last_modified"]:
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    with host_semaphore(url):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("fulltext deadline exceeded")
+        res = httpclient.get(
+            url,
+            headers=headers,
+            timeout=min(FULLTEXT_TIMEOUT, remaining),
+            deadline=deadline
+        )
+    if res.status_code == 304 and cached:
+        return cached, "not_modified"
+    res.raise_for_status()
+    if "html" not in res.headers.get("Content-Type", "html"):
+        raise ValueError(f"HTML değil: {res.headers.get('Content-Type')}")
+    if len(res.content) > FULLTEXT_MAX_BYTES:
+        raise ValueError(f"sayfa çok büyük: {len(res.content)} bayt")
+
+    # Başlıkta charset yoksa ham baytlar: readability sayfanın <meta charset>'ini okur
+    # (requests text/html için ISO-8859-1 varsayar, Türkçe karakterler bozulur)
+    if "charset=" in res.headers.get("Content-Type", "").lower():
+        page = res.text
+    else:
+        page = res.content
+    return {
+        "etag": res.headers.get("ETag"),
+        "last_modified": res.headers.get("Last-Modified"),
+        "text": extract_text(page, url),
+    }, "fetched"
+
+def start_extraction(articles, cache):
+    # Arka planda başlat (pipeline dedup vb. ile devam eder); sonuç finish_extraction'da
+    if importlib.util.find_spec("readability") is None:
+        print("[fulltext] readability-lxml kurulu değil, atlanıyor")
+        return None
+    deadline = time.monotonic() + FULLTEXT_DEADLINE
+    executor = ThreadPoolExecutor(max_workers=FULLTEXT_WORKERS)
+    jobs = {}
+    for article in articles:
+        url = article.get("url")
+        if not url or url in jobs:
+            continue
+        cached = cache.get(url)
+        if cached and not (cached["etag"] or cached["last_modified"]):
+            # Doğrulanamayan cache kaydı: sayfa tekrar indirilmez
+            jobs[url] = (None, cached)
+            runstats.incr("fulltext.cached")
+            continue
+        jobs[url] = (executor.submit(fetch_page, url, cached, deadline), cached)
+    executor.shutdown(wait=False)
+    return {"articles": articles, "jobs": jobs, "deadline": deadline}
+
+def finish_extraction(job, cache):
+    # Yetişen sonuçları haberlere uygula; long_summary RSS özetinden uzunsa değiştirilir
+    futures = [future for future, _ in job["jobs"].values() if future]
+    wait(futures, timeout=max(0.0, job["deadline"] - time.monotonic()))
+
+    texts = {}
+    for url, (future, cached) in job["jobs"].items():
+        if future is None:
+            texts[url] = cached["text"]
+            continue
+        if not future.done():
+            future.cancel()
+            runstats.incr("fulltext.timeout")
+            continue
+        try:
+            page, status = future.result()
+        except Exception as exc:
+            runstats.error("fulltext", exc)
+            continue
+        runstats.incr(f"fulltext.{status}")
+        cache.put(url, page)
+        texts[url] = page["text"]
+
+    enriched = 0
+    for article in job["articles"]:
+        text = texts.get(article.get("url"))
+        if text and len(text) > len(article["long_summary"]):
+            article["long_summary"] = build_long_summary(text, FULLTEXT_SUMMARY_CHARS)
+            article["long_summary_tr"] = article["long_summary"]
+            enriched += 1
+
+    cache.flush()
+    cache.evict()
+    runstats.incr("fulltext.enriched", enriched)
+    print(f"[fulltext] {len(job['jobs'])} sayfa, {enriched} haber tam metinle zenginleşti")
@@ -0,0 +1,127 @@
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import runstats
+from .jsonstream import atomic_write_text
+
+# 🩺 Feed sağlığı ve devre kesici (ölü feed'ler her çalışmada timeout harcamasın)
+HEALTH_FILE = Path("news/feed_health.json")
+HEALTH_WINDOW = 50              # Başarı oranı / gecikme için saklanan son deneme sayısı
+BREAKER_THRESHOLD = 3           # Art arda bu kadar hatada devre açılır (feed atlanır)
+BREAKER_COOLDOWN = 3600         # İlk açılışta bekleme (saniye); her yeni açılışta iki katı
+BREAKER_MAX_COOLDOWN = 24 * 3600
+RUN_BUDGET = 240                # Bir çalışmanın toplam süre bütçesi (saniye)
+
+def load_health():
+    if HEALTH_FILE.exists():
+        try:
+            return json.loads(HEALTH_FILE.read_text(encoding="utf-8")).get("feeds", {})
+        except ValueError:
+            return {}
+    return {}
+
+def feed_record(health, source, url):
+    return health.setdefault(url, {
+        "source": source,
+        "state": "closed",
+        "history": [],
+        "consecutive_failures": 0,
+        "opens": 0,
+        "opened_at": None,
+        "last_error": None,
+        "last_success_at": None,
+    })
+
+def cooldown(record):
+    return min(BREAKER_MAX_COOLDOWN, BREAKER_COOLDOWN * 2 ** max(0, record["opens"] - 1))
+
+def allow_fetch(record, now):
+    # closed: indir; open: bekleme süresi dolana kadar atla; sonra half_open ile tek deneme
+    if record["state"] == "open" and now >= record["opened_at"] + cooldown(record):
+        record["state"] = "half_open"
+    return record["state"] != "open"
+
+def select_feeds(feeds, health, now=None):
+    # Devresi açık feed'leri ele; (indirilecekler, atlananlar)
+    now = now or time.time()
+    allowed, skipped = [], []
+    for source, url in feeds:
+        record = feed_record(health, source, url)
+        (allowed if allow_fetch(record, now) else skipped).append((source, url))
+
+    for source, url in skipped:
+        retry_in = health[url]["opened_at"] + cooldown(health[url]) - now
+        print(f"[health] {source:<24} atlandı (devre açık, {retry_in / 60:.0f} dk sonra denenecek)")
+        runstats.feed(source, status="skipped", error=health[url]["last_error"])
+    runstats.incr("health.skipped", len(skipped))
+    return allowed, skipped
+
+def record_result(record, fetched, now):
+    if fetched.get("deadline_skipped"):
+        # Çalışma süresi dolduğu için hiç istenmedi: ne başarı ne hata (devre durumu aynen kalır)
+        return
+    error = fetched.get("error") or fetched.get("parse_error")
+    ok = error is None
+    record["history"] = (record["history"] + [
+        {"at": int(now), "ok": ok, "ms": round(fetched["elapsed"] * 1000)}
+    ])[-HEALTH_WINDOW:]
+
+    if ok:
+        record.update(state="closed", consecutive_failures=0, opens=0, opened_at=None,
+                      last_success_at=int(now))
+        return
+
+    record["consecutive_failures"] += 1
+    record["last_error"] = error
+    # half_open denemesi başarısızsa ya da eşik aşıldıysa devre (yeniden) açılır
+    if record["state"] == "half_open" or record["consecutive_failures"] >= BREAKER_THRESHOLD:
+        record.update(state="open", opens=record["opens"] + 1, opened_at=now)
+        print(f"[health] {record['source']:<24} devre açıldı ({record['consecutive_failures']} hata: {error})")
+        runstats.incr("health.opened")
+
+def record_results(health, fetched_feeds, now=None):
+    now = now or time.time()
+    for fetched in fetched_feeds:
+        record_result(feed_record(health, fetched["source"], fetched["url"]), fetched, now)
+
+def percentile(values, p):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+def feed_summary(record):
+    history = record["history"]
+    latencies = [h["ms"] for h in history if h["ok"]]
+    return {
+        "source": record["source"],
+        "state": record["state"],
+        "success_rate": round(sum(h["ok"] for h in history) / len(history), 3) if history else None,
+        "attempts": len(history),
+        "latency_ms": {f"p{p}": percentile(latencies, p) for p in (50, 90, 99)},
+        "consecutive_failures": record["consecutive_failures"],
+        "last_error": record["last_error"],
+        "last_success_at": record["last_success_at"],
+    }
+
+def save_health(health, feeds=None):
+    # Operatörler için okunur rapor + bir sonraki çalışmanın kullandığı ham kayıt aynı dosyada
+    if feeds is not None:
+        # Kaynak listesinden çıkarılmış feed'lerin kaydı taşınmaz
+        urls = {url for _, url in feeds}
+        health = {url: record for url, record in health.items() if url in urls}
+
+    summaries = {url: feed_summary(record) for url, record in health.items()}
+    unhealthy = sorted(
+        (url for url, s in summaries.items() if s["state"] != "closed" or s["consecutive_failures"]),
+        key=lambda url: (-summaries[url]["consecutive_failures"], summaries[url]["source"])
+    )
+    runstats.incr("health.open", sum(s["state"] == "open" for s in summaries.values()))
+    atomic_write_text(HEALTH_FILE, json.dumps({
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "unhealthy": unhealthy,
+        "summary": summaries,
+        "feeds": health,
+    }, ensure_ascii=False, indent=1))
@@ -0,0 +1,155 @@
+import email.utils
+import importlib.util
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+from . import runstats
+
+# 🔌 Ortak HTTP oturumu: feed, çeviri ve görsel istekleri aynı bağlantı havuzlarını kullanır
+USER_AGENT = "HaberRobotu/1.0 (+https://newest-resu.github.io)"
+POOL_HOSTS = 64             # Açık tutulan host havuzu (feed + çeviri + görsel host'ları)
+DEFAULT_POOL_SIZE = 2       # Host başına açık tutulan bağlantı
+HOST_POOL_SIZES = {}        # Örn. {"feeds.bbci.co.uk": 4}; configure_host ile de eklenir
+RETRIES = 2                 # Geçici hatalarda ek deneme sayısı
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+BACKOFF_BASE = 0.5          # İlk bekleme (saniye); her denemede iki katına çıkar
+BACKOFF_MAX = 8
+
+_session = None
+_session_lock = threading.Lock()
+_reported = {}              # record_connection_stats'in son raporladığı host toplamları
+
+def accept_encoding():
+    # urllib3 brotli modülü varsa br yanıtlarını da açabilir
+    if importlib.util.find_spec("brotli") is None:
+        return "gzip, deflate"
+    return "gzip, deflate, br"
+
+def make_adapter(pool_size):
+    import requests.adapters
+
+    # Yeniden denemeyi request() yapar; urllib3'ün kendi denemesi kapalı
+    return requests.adapters.HTTPAdapter(
+        pool_connections=POOL_HOSTS,
+        pool_maxsize=pool_size,
+        max_retries=0
+    )
+
+def shared_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+
+            session = requests.Session()
+            session.headers.update({
+                "User-Agent": USER_AGENT,
+                "Accept-Encoding": accept_encoding(),
+            })
+            default = make_adapter(DEFAULT_POOL_SIZE)
+            session.mount("http://", default)
+            session.mount("https://", default)
+            for host, size in HOST_POOL_SIZES.items():
+                for scheme in ("http", "https"):
+                    session.mount(f"{scheme}://{host}/", make_adapter(size))
+            _session = session
+        return _session
+
+def configure_host(url, pool_size):
+    # Belirli bir host için daha büyük havuz (örn. paralel çeviri istekleri)
+    host = urlsplit(url).netloc.lower()
+    if HOST_POOL_SIZES.get(host) == pool_size:
+        return
+    HOST_POOL_SIZES[host] = pool_size
+    session = shared_session()
+    with _session_lock:
+        for scheme in ("http", "https"):
+            session.mount(f"{scheme}://{host}/", make_adapter(pool_size))
+
+def backoff_delay(attempt, response=None):
+    # Retry-After varsa ona uy, yoksa jitter'lı üstel bekleme
+    if response is not None:
+        value = response.headers.get("Retry-After")
+        if value:
+            try:
+                return min(BACKOFF_MAX, float(value))
+            except ValueError:
+                pass
+            try:
+                until = email.utils.parsedate_to_datetime(value).timestamp()
+                return min(BACKOFF_MAX, max(0.0, until - time.time()))
+            except (TypeError, ValueError):
+                pass
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)
+    return delay * random.uniform(0.5, 1.5)
+
+def request(method, url, retries=RETRIES, deadline=None, **kwargs):
+    # Bağlantı hatası / geçici HTTP durumlarında yeniden dener; deadline aşılacaksa denemez
+    import requests
+
+    session = shared_session()
+    for attempt in range(retries + 1):
+        response = None
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                return response
+
+        delay = backoff_delay(attempt, response)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            if response is None:
+                raise TimeoutError("run deadline exceeded")
+            return response
+        if response is not None:
+            response.close()
+        runstats.incr("http.retries")
+        time.sleep(delay)
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+def connection_stats():
+    # Host başına yapılan istek / açılan bağlantı; fark keep-alive ile yeniden kullanım
+    if _session is None:
+        return {}
+    hosts = {}
+    with _session_lock:
+        adapters = {id(a): a for a in _session.adapters.values()}.values()
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats = hosts.setdefault(pool.host, {"requests": 0, "connections": 0})
+                stats["requests"] += pool.num_requests
+                stats["connections"] += pool.num_connections
+
+    for stats in hosts.values():
+        stats["reused"] = stats["requests"] - stats["connections"]
+    return dict(sorted(hosts.items()))
+
+def record_connection_stats():
+    # Önceki çağrıdan bu yana yapılan istekleri runstats sayaçlarına yaz
+    # (havuz sayaçları süreç boyunca birikir; daemon her turda yalnızca farkı raporlar)
+    hosts = {}
+    for host, stats in connection_stats().items():
+        last = _reported.get(host, {})
+        if stats["requests"] < last.get("requests", 0):
+            last = {}  # configure_host havuzu yeniledi: sayaçlar sıfırdan başladı
+        delta = {field: stats[field] - last.get(field, 0) for field in stats}
+        _reported[host] = stats
+        if delta["requests"]:
+            hosts[host] = delta
+    for field in ("requests", "connections", "reused"):
+        runstats.incr(f"http.{field}", sum(s[field] for s in hosts.values()))
+    return hosts
@@ -0,0 +1,213 @@
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+from . import httpclient, runstats
+from .fetch import host_semaphore
+from .jsonstream import atomic_write_text
+
+# 🖼️ Görsel aşaması: adayları yokla, en iyisini seç, küçük WebP kopyasını depoya yaz
+IMAGES = os.environ.get("IMAGES") == "1"
+IMAGE_WORKERS = 8
+IMAGE_TIMEOUT = 10
+IMAGE_DEADLINE = 45             # Aşamanın toplam süresi (saniye)
+PROBE_BYTES = 64 * 1024         # Range isteğinde okunan ön kısım (boyut başlığı için yeterli)
+IMAGE_MIN_WIDTH = 300           # Daha dar görseller (ikon, logo) ancak başka aday yoksa seçilir
+IMAGE_MAX_WIDTH = 1600          # Bundan genişi daha iyi sayılmaz
+IMAGE_MAX_BYTES = 8_000_000     # Küçük kopya için indirilecek en büyük dosya
+
+THUMB_DIR = Path("news/img")
+THUMB_INDEX = THUMB_DIR / "index.json"  # Kaynak URL -> küçük kopya (tekrar indirmemek için)
+THUMB_WIDTH = 480
+THUMB_QUALITY = 70
+
+def has_pillow():
+    # Pillow opsiyonel; yoksa görsel seçilir ama küçük kopya üretilmez
+    return importlib.util.find_spec("PIL") is not None
+
+def sniff_size(data):
+    # Dosyanın ilk baytlarından (genişlik, yükseklik); Pillow yoksa ya da okunamazsa None
+    if not has_pillow():
+        return None, None
+    from PIL import Image
+
+    try:
+        return Image.open(io.BytesIO(data)).size
+    except Exception:
+        return None, None
+
+def probe_image(candidate, deadline):
+    # Range'li GET: tür, toplam boyut ve ön kısımdan piksel boyutu; kırık görselde None
+    url = candidate["url"]
+    with host_semaphore(url):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("image deadline exceeded")
+        res = httpclient.get(
+            url,
+            headers={"Range": f"bytes=0-{PROBE_BYTES - 1}"},
+            timeout=min(IMAGE_TIMEOUT, remaining),
+            deadline=deadline,
+            stream=True
+        )
+    try:
+        content_type = res.headers.get("Content-Type", "").split(";")[0].strip()
+        if res.status_code not in (200, 206) or not content_type.startswith("image/"):
+            return None
+        prefix = res.raw.read(PROBE_BYTES, decode_content=True)
+        if res.status_code == 206 and "/" in res.headers.get("Content-Range", ""):
+            total = res.headers["Content-Range"].rsplit("/", 1)[1]
+        else:
+            total = res.headers.get("Content-Length")
+    finally:
+        res.close()
+    # image/* başlığıyla dönen HTML (hata / giriş sayfası) kırık sayılır; SVG zaten metin
+    if content_type != "image/svg+xml" and prefix.lstrip()[:1] == b"<":
+        return None
+
+    width, height = sniff_size(prefix)
+    return {
+        **candidate,
+        "type": content_type,
+        "bytes": int(total) if total and total.isdigit() else candidate.get("bytes"),
+        "width": width or candidate.get("width"),
+        "height": height or candidate.get("height"),
+    }
+
+def image_score(candidate, order):
+    # Yeterince geniş > daha geniş (sınıra kadar) > daha küçük dosya > feed'deki sıra.
+    # Genişlik bilinmiyorsa (Pillow yok) dosya boyutu bakılmaz: küçük dosya çoğu zaman ikondur
+    width = candidate.get("width") or 0
+    return (
+        width >= IMAGE_MIN_WIDTH,
+        min(width, IMAGE_MAX_WIDTH),
+        -(candidate.get("bytes") or 0) if width else 0,
+        -order,
+    )
+
+def make_thumbnail(url, deadline):
+    # İçerik hash'iyle adlandırılır: aynı görsel farklı URL'den gelse de bir kez yazılır
+    with host_semaphore(url):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("image deadline exceeded")
+        res = httpclient.get(url, timeout=min(IMAGE_TIMEOUT, remaining), deadline=deadline)
+    res.raise_for_status()
+    if len(res.content) > IMAGE_MAX_BYTES:
+        raise ValueError(f"görsel çok büyük: {len(res.content)} bayt")
+
+    path = THUMB_DIR / f"{hashlib.sha1(res.content).hexdigest()[:16]}.webp"
+    if path.exists():
+        runstats.incr("images.thumb_existing")
+        return path.as_posix()
+
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(res.content))
+    image.thumbnail((THUMB_WIDTH, THUMB_WIDTH * 4))
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+    tmp = path.with_name(path.name + ".tmp")
+    image.save(tmp, "WEBP", quality=THUMB_QUALITY)
+    os.replace(tmp, path)
+    runstats.incr("images.thumb_created")
+    return path.as_posix()
+
+def load_thumb_index():
+    if THUMB_INDEX.exists():
+        try:
+            return json.loads(THUMB_INDEX.read_text(encoding="utf-8"))
+        except ValueError:
+            return {}
+    return {}
+
+def collect(futures, deadline, where):
+    # Süresi içinde biten sonuçlar; hata ve zaman aşımında sonuç istisna nesnesidir
+    wait(futures.values(), timeout=max(0.0, deadline - time.monotonic()))
+    results = {}
+    for key, future in futures.items():
+        if not future.done():
+            future.cancel()
+            runstats.incr(f"images.{where}_timeout")
+            results[key] = TimeoutError(f"image {where} deadline exceeded")
+            continue
+        try:
+            results[key] = future.result()
+        except Exception as exc:
+            runstats.error(f"images.{where}", exc)
+            results[key] = exc
+    return results
+
+def process_images(fresh, articles):
+    # fresh: bu turda kurulan haberler (adayları yoklanır); articles: çıktının tamamı (temizlik için)
+    deadline = time.monotonic() + IMAGE_DEADLINE
+    THUMB_DIR.mkdir(parents=True, exist_ok=True)
+    index = load_thumb_index()
+    executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS)
+
+    # 1) Tüm adaylar aynı anda yoklanır
+    probes = {
+        (i, order): executor.submit(probe_image, candidate, deadline)
+        for i, article in enumerate(fresh)
+        for order, candidate in enumerate(article.pop("image_candidates", None) or [])
+    }
+    probed = collect(probes, deadline, "probe")
+
+    by_article = defaultdict(list)
+    for (i, order), result in probed.items():
+        by_article[i].append((result, order))
+
+    chosen = {}
+    broken = set()
+    for i, results in by_article.items():
+        usable = [(result, order) for result, order in results if isinstance(result, dict)]
+        if usable:
+            chosen[i] = max(usable, key=lambda item: image_score(*item))
+        elif all(result is None for result, _ in results):
+            broken.add(i)
+
+    for i, article in enumerate(fresh):
+        if i in chosen:
+            article["image"] = chosen[i][0]["url"]
+        elif i in broken:
+            # Tüm adaylar kesin olarak kırık (404, görsel olmayan yanıt): bozuk görsel gösterme
+            article["image"] = None
+    runstats.incr("images.chosen", len(chosen))
+    runstats.incr("images.broken", len(broken))
+
+    # 2) Seçilen görsellerin küçük kopyaları (Pillow varsa; daha önce üretilenler atlanır)
+    if has_pillow():
+        thumbs = {}
+        for i in chosen:
+            url = fresh[i]["image"]
+            if url in index and Path(index[url]).exists():
+                fresh[i]["thumb"] = index[url]
+                runstats.incr("images.thumb_cached")
+            elif url not in thumbs:
+                thumbs[url] = executor.submit(make_thumbnail, url, deadline)
+        made = collect(thumbs, deadline, "thumb")
+        for url, result in made.items():
+            if isinstance(result, str):
+                index[url] = result
+        for i in chosen:
+            if isinstance(made.get(fresh[i]["image"]), str):
+                fresh[i]["thumb"] = made[fresh[i]["image"]]
+    executor.shutdown(wait=False)
+
+    prune_thumbnails(articles, index)
+    print(f"[images] {len(probes)} aday, {len(chosen)} seçildi, {len(broken)} kırık")
+
+def prune_thumbnails(articles, index):
+    # Çıktıda kalmayan haberlerin küçük kopyalarını ve index kayıtlarını sil
+    keep = {a["thumb"] for a in articles if a.get("thumb")}
+    for path in THUMB_DIR.glob("*.webp"):
+        if path.as_posix() not in keep:
+            path.unlink()
+    index = {url: thumb for url, thumb in index.items() if thumb in keep}
+    atomic_write_text(THUMB_INDEX, json.dumps(index, ensure_ascii=False))
@@ -0,0 +1,64 @@
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+
+from .jsonstream import iter_articles
+
+SEEN_INDEX_FILE = Path("news/seen_entries.json")
+
+def entry_identity(e):
+    # Kalıcı anahtar (GUID > link > başlık hash'i) ve içerik hash'i
+    title = e.get("title", "")
+    summary = e.get("summary") or e.get("description") or ""
+    key = e.get("id") or e.get("link") or hashlib.sha1(title.encode("utf-8")).hexdigest()
+    published = e.get("published_parsed")
+    content = "\x1f".join([
+        title,
+        summary,
+        e.get("link") or "",
+        ",".join(str(x) for x in published[:6]) if published else ""
+    ])
+    return key, hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+def article_id(entry_key):
+    # Haberin kalıcı, içerikten türetilmiş kimliği (URL'lerde ve news/a/<id>.json'da)
+    return hashlib.sha1(entry_key.encode("utf-8")).hexdigest()[:12]
+
+def load_previous_articles(path):
+    if not path.exists():
+        return {}
+    previous = {}
+    try:
+        for a in iter_articles(path):
+            if a.get("entry_key"):
+                a.setdefault("id", article_id(a["entry_key"]))
+                previous[a["entry_key"]] = a
+    except ValueError:
+        return {}
+    return previous
+
+def load_seen_index():
+    if SEEN_INDEX_FILE.exists():
+        try:
+            return json.loads(SEEN_INDEX_FILE.read_text(encoding="utf-8"))
+        except ValueError:
+            return {}
+    return {}
+
+def build_seen_index(articles, digests, old_index):
+    # Her küme üyesi -> (içerik hash'i, kümenin ana haberi)
+    index = {}
+    for article in articles:
+        for src in article["sources"]:
+            key = src.get("entry_key")
+            digest = digests.get(key) or old_index.get(key, {}).get("hash")
+            if key and digest:
+                index[key] = {"hash": digest, "article": article["entry_key"]}
+    return index
+
+def is_expired(article, cutoff_time):
+    stamp = article.get("published_at") or article.get("first_seen_at")
+    if not stamp:
+        return False
+    return datetime.fromisoformat(stamp) < cutoff_time
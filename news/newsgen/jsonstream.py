@@ -0,0 +1,147 @@
+import json
+import os
+from pathlib import Path
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\n\r"
+
+_decoder = json.JSONDecoder()
+
+class _Buffer:
+    # Dosyayı parça parça okuyan, tüketilen kısmı atan basit tampon
+    def __init__(self, f):
+        self.f = f
+        self.data = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.data = self.data[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        # Boşlukları atlayıp sıradaki karakteri döndür (dosya sonunda "")
+        while True:
+            while self.pos < len(self.data) and self.data[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.data):
+                return self.data[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars):
+        ch = self.peek()
+        if ch not in chars:
+            raise ValueError(f"Beklenen {chars!r}, bulunan {ch!r} (konum {self.pos})")
+        self.pos += 1
+        return ch
+
+    def value(self):
+        # Tam bir JSON değeri tampona sığana kadar okumaya devam et
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.data, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # Sayılar tampon sınırında bölünmüş olabilir
+            if end == len(self.data) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return value
+
+def iter_articles(path, meta=None, key="articles"):
+    # {"...": ..., "articles": [ {...}, {...} ]} dosyasındaki haberleri tek tek üret.
+    # Diğer üst seviye alanlar `meta` sözlüğüne yazılır.
+    meta = {} if meta is None else meta
+    with open(path, "r", encoding="utf-8") as f:
+        buf = _Buffer(f)
+        buf.expect("{")
+        if buf.peek() == "}":
+            return
+        while True:
+            name = buf.value()
+            buf.expect(":")
+            if name == key:
+                buf.expect("[")
+                if buf.peek() == "]":
+                    buf.pos += 1
+                else:
+                    while True:
+                        yield buf.value()
+                        if buf.expect(",]") == "]":
+                            break
+            else:
+                meta[name] = buf.value()
+            if buf.expect(",}") == "}":
+                return
+
+def atomic_write_text(path, text):
+    # Önce geçici dosyaya yaz, sonra rename: yarım kalan dosya oluşmaz
+    path.parent.mkdir(exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+class ArticleWriter:
+    # {"meta...", "articles": [...]} dosyasını haber haber yazar; kapanışta atomik rename.
+    def __init__(self, path, meta=None, pretty=False, key="articles"):
+        self.path = Path(path)
+        self.meta = meta or {}
+        self.pretty = pretty
+        self.key = key
+        self.tmp = self.path.with_name(self.path.name + ".tmp")
+        self.count = 0
+        self.f = None
+
+    def _dumps(self, value, level):
+        if not self.pretty:
+            return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        text = json.dumps(value, ensure_ascii=False, indent=2)
+        return text.replace("\n", "\n" + "  " * level)
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.f = open(self.tmp, "w", encoding="utf-8")
+        nl, sep = ("\n  ", ": ") if self.pretty else ("", ":")
+        self.f.write("{")
+        for name, value in self.meta.items():
+            self.f.write(f"{nl}{json.dumps(name)}{sep}{self._dumps(value, 1)},")
+        self.f.write(f"{nl}{json.dumps(self.key)}{sep}[")
+        return self
+
+    def write(self, article):
+        if self.count:
+            self.f.write(",")
+        if self.pretty:
+            self.f.write("\n    ")
+        self.f.write(self._dumps(article, 2))
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.f.close()
+            self.tmp.unlink(missing_ok=True)
+            return False
+        if self.pretty:
+            self.f.write("\n  ]\n}\n" if self.count else "]\n}\n")
+        else:
+            self.f.write("]}")
+        self.f.close()
+        os.replace(self.tmp, self.path)
+        return False
+
+def write_articles(path, articles, meta=None, pretty=False):
+    with ArticleWriter(path, meta=meta, pretty=pretty) as writer:
+        for article in articles:
+            writer.write(article)
+    return writer.count
@@ -0,0 +1,169 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from .classify import (
+    build_possible_impacts,
+    build_why_important,
+    determine_origin,
+    determine_subcategory,
+    is_local_news,
+    slugify_category,
+)
+from .fetch import FEED_ENTRY_LIMIT, restore_entry, snapshot_entry
+from .incremental import entry_identity
+from .text import (
+    build_long_summary,
+    clean_html,
+    extract_image,
+    image_candidates,
+    normalize_published_at,
+    normalize_summary_html,
+    parse_entry_date,
+)
+
+# 🧮 Parse + normalize aşaması (feed sayısı arttıkça ayrı süreçlere dağıtılır)
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", "0")) or os.cpu_count() or 1
+PARSE_MIN_FEEDS = 8     # Bundan az gövde varsa süreç havuzu açılmaz (başlatma maliyeti)
+PARSE_CHUNK_SIZE = 4    # Bir göreve gönderilen feed sayısı (IPC maliyetini böler)
+
+CUTOFF_HOURS = 36
+
+def cutoff_time(now=None):
+    # Zaman import anında değil, çalışma başında hesaplanır (uzun yaşayan süreçler için)
+    return (now or datetime.now(timezone.utc)) - timedelta(hours=CUTOFF_HOURS)
+
+def build_article(source, e, cutoff=None):
+    published_dt = parse_entry_date(e)
+    if published_dt and published_dt < (cutoff or cutoff_time()):
+        return None
+
+    raw_title = clean_html(e.get("title", ""))
+    raw_summary, summary_image, long_summary = normalize_summary_html(
+        e.get("summary") or e.get("description") or ""
+    )
+    if not raw_summary:
+        raw_summary, long_summary = raw_title, build_long_summary(raw_title)
+
+    # media:content / thumbnail / enclosure yoksa özetteki <img>
+    image = extract_image(e) or summary_image
+    candidates = image_candidates(e, summary_image)
+
+    origin = determine_origin(source)
+
+    sub_category = determine_subcategory(
+        source,
+        origin,
+        raw_title,
+        raw_summary
+    )
+
+    category = sub_category
+    category_slug = slugify_category(sub_category)
+    is_local = is_local_news(origin, sub_category)
+
+    title = raw_title
+    summary = raw_summary
+
+    why_important = build_why_important(sub_category)
+    possible_impacts = build_possible_impacts(sub_category)
+    published_at = normalize_published_at(e)
+
+    return {
+        "origin": origin,
+        "category": category,
+        "category_slug": category_slug,
+        "is_local": is_local,
+        "source": source,
+        "title": title,
+        "title_tr": title,
+        "summary": summary,
+        "summary_tr": summary,
+        "long_summary": long_summary,
+        "long_summary_tr": long_summary,
+        "why_important": why_important,
+        "possible_impacts": possible_impacts,
+        "url": e.get("link"),
+        "image": image,
+        "image_candidates": candidates,
+        "published_at": published_at
+    }
+
+def process_entries(source, entries, cutoff, known):
+    # Girdi başına kompakt kayıt: (entry_key, içerik hash'i, haber | None)
+    # Hash'i `known` ile aynı olan girdi yeniden kurulmaz (önceki haber kullanılacak)
+    records = []
+    for e in entries:
+        key, digest = entry_identity(e)
+        article = None
+        if known.get(key) != digest:
+            article = build_article(source, e, cutoff)
+        records.append((key, digest, article))
+    return records
+
+def parse_feed(source, body, cutoff, known):
+    import feedparser
+
+    feed = feedparser.parse(body)
+    if feed.bozo and not feed.entries:
+        # Bozuk / feed olmayan yanıt (HTML hata sayfası vb.): sağlık kaydında hata sayılır
+        exc = feed.get("bozo_exception")
+        return None, [], f"{type(exc).__name__}: {exc}" if exc else "ParseError"
+
+    entries = feed.entries[:FEED_ENTRY_LIMIT]
+    return [snapshot_entry(e) for e in entries], process_entries(source, entries, cutoff, known), None
+
+_worker_known = {}
+
+def init_worker(known):
+    # Görülen girdi hash'leri her işçiye bir kez gönderilir, her görevde değil
+    global _worker_known
+    _worker_known = known
+
+def parse_chunk(chunk, cutoff):
+    return [parse_feed(source, body, cutoff, _worker_known) for source, body in chunk]
+
+def parse_feeds(fetched_feeds, state, cutoff, known, workers=None):
+    # Feed başına kayıt listesi, fetched_feeds sırasıyla; state 304 / yeni gövdeye göre güncellenir
+    workers = workers or PARSE_WORKERS
+    bodies = [f for f in fetched_feeds if not f["not_modified"] and f["body"] is not None]
+
+    if workers > 1 and len(bodies) >= PARSE_MIN_FEEDS:
+        chunks = [
+            [(f["source"], f["body"]) for f in bodies[i:i + PARSE_CHUNK_SIZE]]
+            for i in range(0, len(bodies), PARSE_CHUNK_SIZE)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=init_worker,
+            initargs=(known,)
+        ) as executor:
+            # map sonuçları gönderim sırasıyla döndürür: çıktı çekirdek sayısından bağımsız
+            parsed = [r for results in executor.map(parse_chunk, chunks, [cutoff] * len(chunks)) for r in results]
+    else:
+        parsed = [parse_feed(f["source"], f["body"], cutoff, known) for f in bodies]
+
+    by_url = {f["url"]: result for f, result in zip(bodies, parsed)}
+    records = []
+    for fetched in fetched_feeds:
+        url = fetched["url"]
+        if fetched["not_modified"]:
+            # 304: önceki girdiler state'ten, parse gerekmez
+            entries = [restore_entry(s) for s in state[url].get("entries", [])]
+            records.append(process_entries(fetched["source"], entries, cutoff, known))
+        elif url in by_url:
+            snapshots, feed_records, error = by_url[url]
+            if error:
+                # Önceki girdiler state'te kalsın; hata health kaydına gider
+                fetched["parse_error"] = error
+                records.append([])
+                continue
+            state[url] = {
+                "etag": fetched.get("etag"),
+                "last_modified": fetched.get("last_modified"),
+                "entries": snapshots
+            }
+            records.append(feed_records)
+        else:
+            records.append([])
+    return records
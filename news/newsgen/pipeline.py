@@ -0,0 +1,202 @@
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import httpclient, runstats
+from .dedup import dedupe_articles
+from .fetch import fetch_all_feeds, load_feed_state, save_feed_state
+from .fulltext import FULLTEXT, finish_extraction, shared_fulltext_cache, start_extraction
+from .health import RUN_BUDGET, load_health, record_results, save_health, select_feeds
+from .images import IMAGES, process_images
+from .incremental import (
+    SEEN_INDEX_FILE,
+    article_id,
+    build_seen_index,
+    is_expired,
+    load_previous_articles,
+    load_seen_index,
+)
+from .jsonstream import atomic_write_text, write_articles
+from .parse import cutoff_time, parse_feeds
+from .sources import RSS_FEEDS
+from .translate import (
+    TRANSLATED_FIELDS,
+    needs_translation,
+    shared_translation_cache,
+    translate_articles,
+)
+
+OUTPUT = Path("news/raw_news.json")
+PRETTY_OUTPUT = os.environ.get("PRETTY_JSON") == "1"
+RUN_STATS_FILE = Path("news/run_stats.json")
+RUN_HISTORY_FILE = Path("news/run_history.jsonl")
+PROFILE_FILE = Path("news/run_profile.pstats")
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--daemon" in argv:
+        # Cron yerine sürekli çalışan süreç: feed'ler kendi yayın hızına göre yoklanır.
+        # --pretty / --precompress her turdaki build_latest çalışmasına iletilir
+        from .daemon import run_daemon
+        run_daemon(build_argv=[a for a in argv if a in ("--pretty", "--precompress")])
+    elif "--profile" in argv:
+        # Sıcak fonksiyonları görmek için: python -m pstats news/run_profile.pstats
+        import cProfile
+        cProfile.runctx("run()", globals(), {"run": run}, str(PROFILE_FILE))
+    else:
+        run()
+
+def is_untranslated(article):
+    # Çeviri servisine ulaşılamayan turdan kalmış yabancı haber: *_tr hâlâ kaynak metnin kopyası
+    return article["origin"] == "yabanci" and bool(article["url"]) and any(
+        needs_translation(article[field]) and article.get(f"{field}_tr") == article[field]
+        for field in TRANSLATED_FIELDS
+    )
+
+def update_articles(fetched_feeds, feed_state, seen_index, previous, translation_cache, now):
+    # İndirilen feed'lerden yeni / değişen haberleri üret, öncekilerle birleştir,
+    # süresi dolanları at, kümele ve yenileri (+ önceden çevrilememişleri) çevir
+    articles = []
+    fresh_keys = set()
+    reused_keys = set()
+    digests = {}
+    cutoff = cutoff_time(now)
+
+    # Önceki haberi hâlâ elde olan girdilerin hash'leri: bunlar yeniden kurulmaz
+    known = {key: seen["hash"] for key, seen in seen_index.items() if seen["article"] in previous}
+
+    with runstats.timer("parse"):
+        parsed_feeds = parse_feeds(fetched_feeds, feed_state, cutoff, known)
+
+    with runstats.timer("build"):
+        for fetched, records in zip(fetched_feeds, parsed_feeds):
+            source = fetched["source"]
+
+            for key, digest, article in records:
+                runstats.feed_incr(source, "entries")
+
+                # Daha önce işlenmiş ve değişmemiş girdi: önceki haberi kullan
+                if article is None and known.get(key) == digest:
+                    runstats.feed_incr(source, "reused")
+                    seen = seen_index[key]
+                    if seen["article"] not in reused_keys:
+                        reused_keys.add(seen["article"])
+                        articles.append(previous[seen["article"]])
+                    continue
+
+                if not article:
+                    runstats.feed_incr(source, "skipped_cutoff")
+                    continue
+
+                runstats.feed_incr(source, "built")
+                article["entry_key"] = key
+                article["id"] = article_id(key)
+                article["first_seen_at"] = now.isoformat()
+                digests[key] = digest
+                fresh_keys.add(key)
+                articles.append(article)
+
+        # Bu turda feed'de görünmeyen ama süresi dolmamış önceki haberler
+        articles.extend(
+            article for key, article in previous.items()
+            if key not in reused_keys and key not in fresh_keys
+        )
+        before_expiry = len(articles)
+        articles = [a for a in articles if not is_expired(a, cutoff)]
+        runstats.incr("articles.expired", before_expiry - len(articles))
+        print(
+            f"[incremental] {len(fresh_keys)} yeni/değişen, "
+            f"{len(articles) - len(fresh_keys)} önceki haber"
+        )
+
+    # Tam metin indirme arka planda; dedup sürerken sayfalar gelir
+    extraction = None
+    if FULLTEXT:
+        fulltext_cache = shared_fulltext_cache()
+        extraction = start_extraction(
+            [a for a in articles if a["entry_key"] in fresh_keys], fulltext_cache
+        )
+
+    with runstats.timer("dedup"):
+        articles = dedupe_articles(articles)
+
+    if extraction:
+        # Çeviriden önce: zenginleşen long_summary de çevrilsin
+        with runstats.timer("fulltext"):
+            finish_extraction(extraction, fulltext_cache)
+
+    if IMAGES:
+        with runstats.timer("images"):
+            process_images([a for a in articles if a["entry_key"] in fresh_keys], articles)
+    for article in articles:
+        article.pop("image_candidates", None)
+
+    with runstats.timer("translate"):
+        hits, misses = translation_cache.hits, translation_cache.misses
+        # Önceki turlarda çevrilemeyenler de sıraya girer; cache'te olanlar istek üretmez
+        retry = [a for a in articles if a["entry_key"] not in fresh_keys and is_untranslated(a)]
+        translate_articles(
+            [a for a in articles if a["entry_key"] in fresh_keys] + retry,
+            translation_cache
+        )
+        runstats.incr("translate.retried", sum(not is_untranslated(a) for a in retry))
+        runstats.incr("translate.cache_hits", translation_cache.hits - hits)
+        runstats.incr("translate.cache_misses", translation_cache.misses - misses)
+
+    return articles, digests, fresh_keys
+
+def save_outputs(articles, digests, seen_index, feed_state):
+    # feed_state, görülen girdi indeksi ve raw_news.json; yeni indeksi döndürür
+    with runstats.timer("write"):
+        save_feed_state(feed_state)
+        seen_index = build_seen_index(articles, digests, seen_index)
+        atomic_write_text(SEEN_INDEX_FILE, json.dumps(seen_index, ensure_ascii=False))
+
+        generated_at = datetime.now(timezone.utc).isoformat()
+        write_articles(
+            OUTPUT,
+            articles,
+            meta={"generated_at": generated_at},
+            pretty=PRETTY_OUTPUT
+        )
+    return seen_index, generated_at
+
+def run():
+    runstats.reset()
+    started = time.monotonic()
+    now = datetime.now(timezone.utc)
+    translation_cache = shared_translation_cache()
+    feed_state = load_feed_state()
+    previous = load_previous_articles(OUTPUT)
+    seen_index = load_seen_index()
+
+    health = load_health()
+    feeds, _ = select_feeds(RSS_FEEDS, health)
+
+    with runstats.timer("fetch"):
+        fetched_feeds = fetch_all_feeds(feeds, feed_state, deadline=started + RUN_BUDGET)
+
+    articles, digests, fresh_keys = update_articles(
+        fetched_feeds, feed_state, seen_index, previous, translation_cache, now
+    )
+    # Süreç genelindeki cache kapatılmaz: aynı süreçte sonraki run() da kullanır
+    translation_cache.flush()
+
+    # Parse hataları da update_articles'tan sonra fetched kayıtlarında
+    record_results(health, fetched_feeds)
+    save_health(health, RSS_FEEDS)
+
+    seen_index, generated_at = save_outputs(articles, digests, seen_index, feed_state)
+
+    runstats.incr("articles.fresh", len(fresh_keys))
+    runstats.incr("articles.output", len(articles))
+    report = runstats.write_report(
+        RUN_STATS_FILE, RUN_HISTORY_FILE,
+        generated_at=generated_at, http=httpclient.record_connection_stats()
+    )
+    print(f"[stats] {report['total_seconds']:.2f}s, aşamalar: {report['stages']}")
+    if report["total_seconds"] > RUN_BUDGET:
+        print(f"[health] çalışma {RUN_BUDGET}s bütçesini aştı")
@@ -0,0 +1,90 @@
+import json
+import threading
+import time
+import traceback
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+HISTORY_LIMIT = 500  # run_history.jsonl içinde tutulan en fazla çalışma
+
+_lock = threading.Lock()
+_started = time.monotonic()
+_stages = {}
+_counters = defaultdict(int)
+_feeds = defaultdict(dict)
+_errors = []
+
+def reset():
+    global _started
+    with _lock:
+        _started = time.monotonic()
+        _stages.clear()
+        _counters.clear()
+        _feeds.clear()
+        _errors.clear()
+
+@contextmanager
+def timer(stage):
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        with _lock:
+            _stages[stage] = _stages.get(stage, 0) + time.monotonic() - started
+
+def incr(name, n=1):
+    with _lock:
+        _counters[name] += n
+
+def feed(source, **fields):
+    # Feed başına alanlar; sayısal alanlar için feed_incr kullan
+    with _lock:
+        _feeds[source].update(fields)
+
+def feed_incr(source, name, n=1):
+    with _lock:
+        _feeds[source][name] = _feeds[source].get(name, 0) + n
+
+def error(where, exc):
+    # Yutulan istisnaları kaybetme: sayacı artır, ilk birkaç tanesinin özetini sakla
+    with _lock:
+        _counters[f"{where}.errors"] += 1
+        if len(_errors) < 50:
+            frames = traceback.extract_tb(exc.__traceback__)
+            _errors.append({
+                "where": where,
+                "error": f"{type(exc).__name__}: {exc}",
+                "at": f"{Path(frames[-1].filename).name}:{frames[-1].lineno}" if frames else None
+            })
+
+def snapshot(**extra):
+    with _lock:
+        return {
+            "total_seconds": round(time.monotonic() - _started, 3),
+            "stages": {k: round(v, 3) for k, v in _stages.items()},
+            "counters": dict(sorted(_counters.items())),
+            "feeds": {
+                source: {k: round(v, 3) if isinstance(v, float) else v for k, v in fields.items()}
+                for source, fields in _feeds.items()
+            },
+            "errors": list(_errors),
+            **extra
+        }
+
+def write_report(path, history_path=None, **extra):
+    report = snapshot(**extra)
+    path = Path(path)
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    if history_path:
+        # Zaman içindeki eğilim için her çalışmanın özeti tek satır
+        history_path = Path(history_path)
+        lines = history_path.read_text(encoding="utf-8").splitlines() if history_path.exists() else []
+        lines.append(json.dumps({
+            k: report[k] for k in ("generated_at", "total_seconds", "stages", "counters") if k in report
+        }, ensure_ascii=False))
+        history_path.write_text("\n".join(lines[-HISTORY_LIMIT:]) + "\n", encoding="utf-8")
+
+    return report
@@ -0,0 +1,110 @@
+RSS_FEEDS = [
+    ("NTV", "https://www.ntv.com.tr/gundem.rss"),
+    ("Habertürk", "https://www.haberturk.com/rss"),
+
+    ("BBC World", "https://feeds.bbci.co.uk/news/world/rss.xml"),
+    ("Reuters World", "https://feeds.reuters.com/Reuters/worldNews"),
+
+    ("Anadolu Ajansı Yerel", "https://www.aa.com.tr/tr/rss/default?cat=yerel"),
+    ("TRT Haber", "https://www.trthaber.com/rss/turkiye.rss"),
+    ("Bursa Hakimiyet", "https://www.bursahakimiyet.com.tr/rss"),
+    ("Yalova Gazetesi", "https://www.yalovagazetesi.com/rss"),
+
+    ("Sky Sports", "https://www.skysports.com/rss/12040"),
+    ("BBC Sport", "https://feeds.bbci.co.uk/sport/rss.xml"),
+
+    ("Webtekno", "https://www.webtekno.com/rss.xml"),
+    ("ShiftDelete", "https://shiftdelete.net/feed"),
+
+    ("Sağlık Bakanlığı", "https://www.saglik.gov.tr/TR/rss"),
+    ("Medimagazin", "https://www.medimagazin.com.tr/rss"),
+
+    ("Dünya Gazetesi", "https://www.dunya.com/rss"),
+    ("Bloomberg HT", "https://www.bloomberght.com/rss"),
+
+    ("Investing TR", "https://tr.investing.com/rss/news_25.rss"),
+    ("Foreks", "https://www.foreks.com/rss"),
+
+    ("Onedio", "https://onedio.com/rss"),
+    ("Elle", "https://www.elle.com/rss/all.xml"),
+
+    ("Popular Science", "https://www.popsci.com/feed"),
+    ("Science Daily", "https://www.sciencedaily.com/rss/all.xml"),
+
+    ("Defense News", "https://www.defensenews.com/arc/outboundfeeds/rss/"),
+    ("Breaking Defense", "https://breakingdefense.com/feed/"),
+
+    ("IGN", "https://feeds.ign.com/ign/all"),
+    ("GameSpot", "https://www.gamespot.com/feeds/news/"),
+
+    ("Motor1", "https://tr.motor1.com/rss/news/all/"),
+    ("Autocar", "https://www.autocar.co.uk/rss"),
+]
+
+SOURCE_SUBCATEGORY_MAP = {
+    # 🇹🇷 TÜRKİYE
+    "NTV": "Gündem",
+    "Habertürk": "Gündem",
+    "TRT Haber": "Gündem",
+
+    "Anadolu Ajansı Yerel": "Yerel",
+    "Bursa Hakimiyet": "Yerel",
+    "Yalova Gazetesi": "Yerel",
+
+    # 🌍 DÜNYA
+    "BBC World": "Dünya",
+    "Reuters World": "Dünya",
+
+    # ⚽ SPOR
+    "Sky Sports": "Spor",
+    "BBC Sport": "Spor",
+
+    # 💻 TEKNOLOJİ
+    "Webtekno": "Teknoloji",
+    "ShiftDelete": "Teknoloji",
+
+    # 🏥 SAĞLIK
+    "Sağlık Bakanlığı": "Sağlık",
+    "Medimagazin": "Sağlık",
+
+    # 💰 EKONOMİ / FİNANS
+    "Dünya Gazetesi": "Ekonomi",
+    "Bloomberg HT": "Finans",
+    "Investing TR": "Finans",
+    "Foreks": "Finans",
+
+    # 🎭 MAGAZİN
+    "Onedio": "Magazin",
+    "Elle": "Magazin",
+
+    # 🔬 BİLİM
+    "Popular Science": "Bilim",
+    "Science Daily": "Bilim",
+
+    # 🛡️ SAVUNMA
+    "Defense News": "Savunma / Askeri",
+    "Breaking Defense": "Savunma / Askeri",
+
+    # 🎮 OYUN
+    "IGN": "Oyun / Dijital",
+    "GameSpot": "Oyun / Dijital",
+
+    # 🚗 OTOMOBİL
+    "Motor1": "Otomobil",
+    "Autocar": "Otomobil",
+}
+
+FOREIGN_SOURCES = {
+    "BBC World",
+    "Reuters World",
+    "Sky Sports",
+    "BBC Sport",
+    "Elle",
+    "Popular Science",
+    "Science Daily",
+    "Defense News",
+    "Breaking Defense",
+    "IGN",
+    "GameSpot",
+    "Autocar"
+}
@@ -0,0 +1,115 @@
+import html
+import re
+from datetime import datetime, timezone
+
+def extract_image(entry, summary_html=""):
+    # 1️⃣ media:content
+    media_content = entry.get("media_content")
+    if media_content and isinstance(media_content, list):
+        for m in media_content:
+            if isinstance(m, dict) and m.get("url"):
+                return m["url"]
+
+    # 2️⃣ media:thumbnail
+    media_thumbnail = entry.get("media_thumbnail")
+    if media_thumbnail and isinstance(media_thumbnail, list):
+        for m in media_thumbnail:
+            if isinstance(m, dict) and m.get("url"):
+                return m["url"]
+
+    # 3️⃣ enclosures
+    enclosures = entry.get("enclosures")
+    if enclosures and isinstance(enclosures, list):
+        for enc in enclosures:
+            if enc.get("type", "").startswith("image") and enc.get("href"):
+                return enc["href"]
+
+    # 4️⃣ summary / description içinden <img> yakala
+    if summary_html:
+        match = IMG_SRC_RE.search(summary_html)
+        if match:
+            return match.group(1)
+
+    # 5️⃣ Hiç görsel yok
+    return None
+
+def _int_attr(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def image_candidates(entry, summary_image=None):
+    # Tüm görsel adayları, feed'in verdiği boyut / tür bilgisiyle (sıra extract_image ile aynı)
+    candidates = []
+    for key in ("media_content", "media_thumbnail"):
+        for m in entry.get(key) or []:
+            if not isinstance(m, dict) or not m.get("url"):
+                continue
+            if m.get("medium", "image") != "image" or not m.get("type", "image/").startswith("image/"):
+                continue
+            candidates.append({
+                "url": m["url"],
+                "width": _int_attr(m.get("width")),
+                "height": _int_attr(m.get("height")),
+            })
+    for enc in entry.get("enclosures") or []:
+        if enc.get("type", "").startswith("image") and enc.get("href"):
+            candidates.append({"url": enc["href"], "bytes": _int_attr(enc.get("length"))})
+    if summary_image:
+        candidates.append({"url": summary_image})
+
+    unique = {}
+    for c in candidates:
+        unique.setdefault(c["url"], c)
+    return list(unique.values())
+
+TAG_RE = re.compile(r"<[^>]+>")
+IMG_SRC_RE = re.compile(r'<img[^>]+src="([^">]+)"')
+# Özet için tek tokenizer: her etiket bir ayraç, <img>'lerde src yakalanır.
+# split() sonucu [metin, src|None, metin, src|None, ...]
+SUMMARY_TOKEN_RE = re.compile(r'<(?:img[^>]+src="([^">]+)"[^>]*|[^>]+)>')
+
+def clean_html(text):
+    if not text:
+        return ""
+    if "&" in text:
+        text = html.unescape(text)
+    if "<" in text:
+        text = TAG_RE.sub("", text)
+    return text.strip()
+
+def normalize_summary_html(summary_html):
+    # Özet HTML'i bir kez çöz: düz metin, ilk <img> adresi ve kısaltılmış uzun özet.
+    # Önce entity'ler açılır (bazı feed'ler etiketleri &lt;p&gt; diye kaçışlı gönderir),
+    # sonra tek split geçişi hem etiketleri atar hem görsel adreslerini toplar
+    if not summary_html:
+        return "", None, ""
+
+    text = html.unescape(summary_html) if "&" in summary_html else summary_html
+    image = None
+    if "<" in text:
+        parts = SUMMARY_TOKEN_RE.split(text)
+        image = next(filter(None, parts[1::2]), None)
+        text = "".join(parts[::2])
+
+    text = text.strip()
+    return text, image, build_long_summary(text)
+
+def parse_entry_date(entry):
+    if hasattr(entry, "published_parsed") and entry.published_parsed:
+        return datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+    return None
+
+def normalize_published_at(entry):
+    dt = parse_entry_date(entry)
+    if dt:
+        return dt.isoformat()
+    return None
+
+def build_long_summary(summary, limit=500):
+    if not summary:
+        return ""
+    if len(summary) <= limit:
+        return summary
+    return summary[:limit].rsplit(" ", 1)[0]
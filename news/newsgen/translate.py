@@ -0,0 +1,326 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from . import httpclient, runstats
+
+# 🌐 Çeviri ayarları (TRANSLATE_URL yerel bir test sunucusuna yönlendirilebilir)
+TRANSLATE_URL = os.environ.get("TRANSLATE_URL", "https://libretranslate.de/translate")
+TRANSLATE_SOURCE = "auto"
+TRANSLATE_TARGET = "tr"
+TRANSLATE_BATCH_SIZE = 20   # Tek istekte gönderilen metin sayısı
+TRANSLATE_WORKERS = 4       # Aynı anda açık çeviri isteği
+TRANSLATE_RATE = 2.5        # Saniyede en fazla istek
+TRANSLATE_BURST = 4         # Token bucket kapasitesi
+TRANSLATE_TIMEOUT = 30
+
+# 🔌 Çeviri backend'i: libretranslate (genel HTTP), local (kendi sunucumuz), argos (süreç içi model)
+TRANSLATOR = os.environ.get("TRANSLATOR", "libretranslate")
+LOCAL_TRANSLATE_URL = os.environ.get("LOCAL_TRANSLATE_URL", "http://127.0.0.1:5000/translate")
+LOCAL_BATCH_SIZE = 50       # Yerel sunucuda hız sınırı yok; istek başına daha çok metin
+LOCAL_WORKERS = 2
+ARGOS_SOURCE = "en"         # Argos "auto" desteklemez; yabancı kaynaklarımız İngilizce
+ARGOS_BATCH_SIZE = 16
+
+TRANSLATION_CACHE_FILE = Path("news/translation_cache.sqlite3")
+TRANSLATION_CACHE_MAX_AGE_DAYS = 30     # Bu süre kullanılmayan çeviriler silinir
+TRANSLATION_CACHE_MAX_ENTRIES = 20000   # En fazla saklanan kayıt
+
+class TranslationCache:
+    # SQLite tabanlı çeviri cache'i: okumalar anlık, yazmalar flush() ile tek transaction
+    def __init__(self, path=TRANSLATION_CACHE_FILE):
+        path.parent.mkdir(exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, used_at INTEGER NOT NULL)"
+        )
+        self.pending = {}
+        self.touched = set()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, text):
+        value = self.get(translation_key(text))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def remember(self, text, translated):
+        self.put(translation_key(text), translated)
+
+    def get(self, key):
+        if key in self.pending:
+            return self.pending[key]
+        row = self.conn.execute(
+            "SELECT value FROM translations WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self.touched.add(key)
+        return json.loads(row[0])
+
+    def put(self, key, value):
+        self.pending[key] = value
+
+    def flush(self):
+        now = int(time.time())
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO translations (key, value, used_at) VALUES (?, ?, ?)",
+                [
+                    (key, json.dumps(value, ensure_ascii=False), now)
+                    for key, value in self.pending.items()
+                ]
+            )
+            self.conn.executemany(
+                "UPDATE translations SET used_at = ? WHERE key = ?",
+                [(now, key) for key in self.touched]
+            )
+        self.pending.clear()
+        self.touched.clear()
+
+    def evict(self, max_age_days=TRANSLATION_CACHE_MAX_AGE_DAYS,
+              max_entries=TRANSLATION_CACHE_MAX_ENTRIES):
+        cutoff = int(time.time()) - max_age_days * 86400
+        with self.conn:
+            self.conn.execute("DELETE FROM translations WHERE used_at < ?", (cutoff,))
+            self.conn.execute(
+                "DELETE FROM translations WHERE key NOT IN ("
+                "SELECT key FROM translations ORDER BY used_at DESC LIMIT ?)",
+                (max_entries,)
+            )
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+def translation_key(text, source=TRANSLATE_SOURCE, target=TRANSLATE_TARGET):
+    # Aynı metin farklı URL / boşluklarla gelse de aynı anahtarı üretir
+    normalized = " ".join(unicodedata.normalize("NFC", text).split())
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return f"{source}:{target}:{digest}"
+
+def load_translation_cache():
+    return TranslationCache()
+
+_shared_cache = None
+
+def shared_translation_cache():
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = load_translation_cache()
+    return _shared_cache
+
+def save_translation_cache(cache):
+    cache.flush()
+    cache.evict()
+
+TRANSLATED_FIELDS = ("title", "summary", "long_summary")
+
+class TokenBucket:
+    # Basit token bucket: saniyede `rate` istek, en fazla `capacity` birikim
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_for = (1 - self.tokens) / self.rate
+            time.sleep(wait_for)
+
+class HTTPTranslator:
+    # LibreTranslate uyumlu /translate; q liste olarak gönderilir (tek istekte batch)
+    name = "libretranslate"
+
+    def __init__(self, url=None, batch_size=None, workers=None, rate=None, burst=None):
+        # Varsayılanlar modül ayarlarından çağrı anında okunur (test / benchmark override'ı için)
+        self.url = url or TRANSLATE_URL
+        self.batch_size = batch_size or TRANSLATE_BATCH_SIZE
+        self.workers = workers or TRANSLATE_WORKERS
+        # rate=None modül ayarı demek; 0 / False hız sınırını tamamen kapatır
+        rate = TRANSLATE_RATE if rate is None else rate
+        self.bucket = TokenBucket(rate, burst or TRANSLATE_BURST) if rate else None
+        # Paralel istekler çeviri host'una açık tutulan aynı bağlantıları kullanır
+        httpclient.configure_host(self.url, self.workers)
+
+    def translate_batch(self, texts):
+        # Tek istekte birden çok metin çevir; hata olursa None döner
+        if self.bucket:
+            self.bucket.acquire()
+        try:
+            r = httpclient.post(
+                self.url,
+                json={
+                    "q": texts,
+                    "source": TRANSLATE_SOURCE,
+                    "target": TRANSLATE_TARGET,
+                    "format": "text"
+                },
+                timeout=TRANSLATE_TIMEOUT
+            )
+            runstats.incr("translate.requests")
+            if r.status_code != 200:
+                runstats.incr(f"translate.http_{r.status_code}")
+                return None
+            translated = r.json().get("translatedText")
+        except Exception as exc:
+            runstats.error("translate", exc)
+            return None
+
+        if not isinstance(translated, list) or len(translated) != len(texts):
+            runstats.incr("translate.bad_response")
+            return None
+        return translated
+
+class LocalServerTranslator(HTTPTranslator):
+    # Aynı makinede / ağda çalışan LibreTranslate: hız sınırı yok, daha büyük batch
+    name = "local"
+
+    def __init__(self, url=None, batch_size=None, workers=None):
+        super().__init__(
+            url=url or LOCAL_TRANSLATE_URL,
+            batch_size=batch_size or LOCAL_BATCH_SIZE,
+            workers=workers or LOCAL_WORKERS,
+            rate=False
+        )
+
+class ArgosTranslator:
+    # Süreç içi CPU modeli (argostranslate); ağ isteği yok, dil paketi önceden kurulmalı
+    name = "argos"
+
+    def __init__(self, batch_size=None):
+        import argostranslate.translate
+
+        self.model = argostranslate.translate.get_translation_from_codes(
+            ARGOS_SOURCE, TRANSLATE_TARGET
+        )
+        if self.model is None:
+            raise RuntimeError(
+                f"argostranslate {ARGOS_SOURCE}->{TRANSLATE_TARGET} paketi kurulu değil"
+            )
+        self.batch_size = batch_size or ARGOS_BATCH_SIZE
+        self.workers = 1  # Model zaten çekirdekleri kullanıyor
+
+    def translate_batch(self, texts):
+        try:
+            return [self.model.translate(text) for text in texts]
+        except Exception as exc:
+            runstats.error("translate", exc)
+            return None
+
+TRANSLATORS = {
+    "libretranslate": HTTPTranslator,
+    "local": LocalServerTranslator,
+    "argos": ArgosTranslator,
+}
+
+def get_translator(name=None):
+    # TRANSLATOR ayarından backend seç; kurulamazsa genel LibreTranslate'e düş
+    name = name or TRANSLATOR
+    if name not in TRANSLATORS:
+        raise ValueError(f"Bilinmeyen çeviri backend'i: {name} ({', '.join(TRANSLATORS)})")
+    try:
+        return TRANSLATORS[name]()
+    except (ImportError, RuntimeError) as exc:
+        if name == "libretranslate":
+            raise
+        print(f"[translate] {name} kullanılamıyor ({exc}), libretranslate'e düşülüyor")
+        runstats.error("translate", exc)
+        return HTTPTranslator()
+
+_shared_translators = {}
+
+def shared_translator(name=None):
+    # Model yükleyen backend'ler (argos) süreç boyunca bir kez kurulur
+    name = name or TRANSLATOR
+    if name not in _shared_translators:
+        _shared_translators[name] = get_translator(name)
+    return _shared_translators[name]
+
+def needs_translation(text):
+    return bool(text) and len(text) >= 5
+
+def translate_texts(texts, cache, translator=None):
+    # Metinleri cache'ten doldur, eksikleri backend'in batch'leri halinde çevirip cache'e yaz
+    translations = {}
+    missing = []
+    for text in dict.fromkeys(t for t in texts if needs_translation(t)):
+        cached = cache.lookup(text)
+        if cached is None:
+            missing.append(text)
+        else:
+            translations[text] = cached
+
+    if not missing:
+        return translations
+
+    translator = translator or shared_translator()
+    batches = [
+        missing[i:i + translator.batch_size]
+        for i in range(0, len(missing), translator.batch_size)
+    ]
+
+    with ThreadPoolExecutor(max_workers=translator.workers) as executor:
+        results = executor.map(translator.translate_batch, batches)
+        for batch, translated in zip(batches, results):
+            if not translated:
+                continue
+            runstats.incr("translate.texts", len(batch))
+            for text, result in zip(batch, translated):
+                translations[text] = result
+                cache.remember(text, result)
+
+    print(f"[translate] {len(missing)} yeni metin, {len(batches)} batch ({translator.name})")
+    return translations
+
+def translate_articles(articles, cache, translator=None):
+    hits, misses = cache.hits, cache.misses
+    foreign = [
+        article for article in articles
+        if article["origin"] == "yabanci" and article["url"]
+    ]
+
+    translations = translate_texts(
+        [article[field] for article in foreign for field in TRANSLATED_FIELDS],
+        cache,
+        translator
+    )
+
+    for article in foreign:
+        for field in TRANSLATED_FIELDS:
+            text = article[field]
+            article[f"{field}_tr"] = translations.get(text, text)
+
+    print(f"[translate] cache: {cache.hits - hits} isabet, {cache.misses - misses} ıska")
+    save_translation_cache(cache)
+    return articles
+
+def translate_to_tr(text: str) -> str:
+    # Tekil çeviri; translate_articles ile aynı içerik-hash cache'ini kullanır
+    if not text or len(text.strip()) < 3:
+        return text
+    translations = translate_texts([text], shared_translation_cache())
+    shared_translation_cache().flush()
+    return translations.get(text, text)
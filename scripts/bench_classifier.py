@@ -0,0 +1,145 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "news"))
+
+from newsgen import categories, classify  # noqa: E402
+
+ARTICLES = 20000
+WORDS_PER_ARTICLE = 60
+
+# Sentetik metinde anahtar kelimelere rastgele eklenen çekim ekleri (baseline substring
+# taraması bunları zaten yakalıyordu; derlenmiş sınıflandırıcı da yakalamalı)
+INFLECTIONS = {
+    "yabanci": ["", "s", "es", "ed", "ing", "'s"],
+    "turkiye": ["", "ı", "i", "lar", "ler", "de", "da", "'nin", "si", "ye", "sinde"],
+}
+
+FILLER = (
+    "the a of to and in for on with said under after before about new "
+    "bir ve ile için gibi daha çok olarak sonra önce yeni dedi kadar"
+).split()
+
+def legacy_subcategory(origin, title, summary):
+    # Eski davranış: her kategori için doğrusal substring taraması
+    text = f"{title} {summary}".lower()
+    keyword_map = (
+        categories.TR_CATEGORY_KEYWORDS
+        if origin == "turkiye"
+        else categories.INTL_CATEGORY_KEYWORDS
+    )
+    for cat, keywords in keyword_map.items():
+        if any(k in text for k in keywords):
+            return cat
+    return None
+
+def legacy_scores(origin, title, summary):
+    # Eski yöntemle kategori skorları: her keyword için ayrı substring sayımı
+    text = f"{title} {summary}".lower()
+    keyword_map = (
+        categories.TR_CATEGORY_KEYWORDS
+        if origin == "turkiye"
+        else categories.INTL_CATEGORY_KEYWORDS
+    )
+    return {
+        cat: sum(text.count(k) for k in keywords)
+        for cat, keywords in keyword_map.items()
+    }
+
+def compiled_subcategory(origin, title, summary):
+    text = f"{title} {summary}".lower()
+    classifier = (
+        classify.TR_CLASSIFIER
+        if origin == "turkiye"
+        else classify.INTL_CLASSIFIER
+    )
+    return classify.best_category(
+        classify.category_scores(text, classifier),
+        classifier
+    )
+
+def synthetic_corpus(n, seed=42):
+    rng = random.Random(seed)
+    keywords = {
+        "turkiye": [k for ks in categories.TR_CATEGORY_KEYWORDS.values() for k in ks],
+        "yabanci": [k for ks in categories.INTL_CATEGORY_KEYWORDS.values() for k in ks],
+    }
+    corpus = []
+    for _ in range(n):
+        origin = rng.choice(("turkiye", "yabanci"))
+        words = [
+            rng.choice(keywords[origin]) + rng.choice(INFLECTIONS[origin])
+            if rng.random() < 0.05 else rng.choice(FILLER)
+            for _ in range(WORDS_PER_ARTICLE)
+        ]
+        corpus.append((origin, " ".join(words[:12]), " ".join(words[12:])))
+    return corpus
+
+def inflection_misses():
+    # Her anahtar kelime, her çekim ekiyle tek başına verildiğinde kendi kategorisinde
+    # skor almalı; kasıtlı dışlananlar (*_SUFFIX_COLLISIONS) dışında kaçırma olmamalı
+    tables = (
+        ("yabanci", categories.INTL_CATEGORY_KEYWORDS, classify.INTL_CLASSIFIER,
+         classify.INTL_SUFFIX_COLLISIONS),
+        ("turkiye", categories.TR_CATEGORY_KEYWORDS, classify.TR_CLASSIFIER,
+         classify.TR_SUFFIX_COLLISIONS),
+    )
+    misses = []
+    for origin, keyword_map, classifier, collisions in tables:
+        for cat, keywords in keyword_map.items():
+            for keyword in keywords:
+                for suffix in INFLECTIONS[origin]:
+                    text = f"{keyword}{suffix}".lower()
+                    if text in collisions:
+                        continue
+                    if cat not in classify.category_scores(text, classifier):
+                        misses.append(text)
+    return misses
+
+def agreement(seed=3):
+    # Tek (çekimli) anahtar kelime içeren haberlerde eski first-match ile aynı kategori oranı;
+    # farklar eskinin substring yanlış eşleşmeleri ("ai" < "said") ya da çoklu kategorili kelimeler
+    rng = random.Random(seed)
+    # Dolgu, eskinin kendi başına yanlış eşleştiği kelimeler olmadan ("said", "ile" ...)
+    neutral = [
+        w for w in FILLER
+        if legacy_subcategory("yabanci", w, "") is None and legacy_subcategory("turkiye", w, "") is None
+    ]
+    total = same = 0
+    for origin, keyword_map in (
+        ("yabanci", categories.INTL_CATEGORY_KEYWORDS),
+        ("turkiye", categories.TR_CATEGORY_KEYWORDS),
+    ):
+        for keywords in keyword_map.values():
+            for keyword in keywords:
+                words = [rng.choice(neutral) for _ in range(20)]
+                words[rng.randrange(20)] = keyword + rng.choice(INFLECTIONS[origin])
+                item = (origin, " ".join(words[:8]), " ".join(words[8:]))
+                total += 1
+                same += legacy_subcategory(*item) == compiled_subcategory(*item)
+    return same / total
+
+def bench(name, fn, corpus):
+    started = time.perf_counter()
+    for origin, title, summary in corpus:
+        fn(origin, title, summary)
+    elapsed = time.perf_counter() - started
+    print(f"{name:<10} {elapsed:7.3f}s  {len(corpus) / elapsed:10.0f} haber/s")
+    return elapsed
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else ARTICLES
+    corpus = synthetic_corpus(n)
+    misses = inflection_misses()
+    if misses:
+        sys.exit(f"çekimli anahtar kelime kaçırıldı: {misses[:20]}")
+    print(f"{n} sentetik haber, haber başına {WORDS_PER_ARTICLE} kelime (anahtar kelimeler çekimli)")
+    print(f"legacy ile aynı kategori: {agreement():.1%}")
+    # legacy: ilk eşleşen kategoride durur; legacy-all: tüm kategorileri skorlar
+    legacy = bench("legacy", legacy_subcategory, corpus)
+    legacy_all = bench("legacy-all", legacy_scores, corpus)
+    compiled = bench("compiled", compiled_subcategory, corpus)
+    print(f"compiled / legacy:     {legacy / compiled:.2f}x")
+    print(f"compiled / legacy-all: {legacy_all / compiled:.2f}x")
@@ -0,0 +1,65 @@
+import html
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "news"))
+
+from newsgen.text import build_long_summary, normalize_summary_html  # noqa: E402
+
+ENTRIES = 50000
+
+def legacy_normalize(summary_html):
+    # Eski yol: clean_html + extract_image regex'i + build_long_summary (derlenmemiş desenler)
+    def clean_html(text):
+        if not text:
+            return ""
+        text = html.unescape(text)
+        return re.sub(r"<[^>]+>", "", text).strip()
+
+    image = None
+    match = re.search(r'<img[^>]+src="([^">]+)"', summary_html)
+    if match:
+        image = match.group(1)
+    text = clean_html(summary_html)
+    return text, image, build_long_summary(text)
+
+def synthetic_summaries(n, seed=7):
+    rng = random.Random(seed)
+    words = "haber son dakika açıklama the army said market bank güncelleme yapay zeka".split()
+    summaries = []
+    for i in range(n):
+        body = " ".join(rng.choice(words) for _ in range(rng.randint(20, 120)))
+        kind = i % 4
+        if kind == 0:
+            summaries.append(body)
+        elif kind == 1:
+            summaries.append(f'<p><img src="https://img.example/{i}.jpg" alt="x"/>{body}</p>')
+        elif kind == 2:
+            summaries.append(f"<div><p>{body}</p><p>Devamı &amp; detaylar &quot;burada&quot;</p></div>")
+        else:
+            summaries.append(f'&lt;p&gt;{body} &lt;a href="https://x.example/{i}"&gt;link&lt;/a&gt;&lt;/p&gt;')
+    return summaries
+
+def bench(name, fn, summaries):
+    started = time.perf_counter()
+    for summary in summaries:
+        fn(summary)
+    elapsed = time.perf_counter() - started
+    print(f"{name:<10} {elapsed:7.3f}s  {elapsed / len(summaries) * 1e6:7.2f} µs/girdi")
+    return elapsed
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else ENTRIES
+    summaries = synthetic_summaries(n)
+
+    # Aynı girdide aynı metni üretmeliler (görsel: yeni yol &amp; çözülmüş HTML'e bakar)
+    for summary in summaries[:200]:
+        assert legacy_normalize(summary)[0] == normalize_summary_html(summary)[0]
+
+    print(f"{n} sentetik özet")
+    legacy = bench("legacy", legacy_normalize, summaries)
+    single = bench("single", normalize_summary_html, summaries)
+    print(f"hızlanma: {legacy / single:.2f}x")
@@ -0,0 +1,53 @@
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "news"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_pipeline import FIXTURE_SOURCES, load_fixture_feeds  # noqa: E402
+from newsgen import parse  # noqa: E402
+
+def fixture_fetches(feed_count):
+    # 4 sentetik fixture feed'i feed_count kaynağa çoğalt (her biri ~25 girdi, fetch_all_feeds çıktısı biçiminde)
+    bodies = list(load_fixture_feeds(100).items())
+    fetched = []
+    for i in range(feed_count):
+        name, body = bodies[i % len(bodies)]
+        fetched.append({
+            "source": FIXTURE_SOURCES[name],
+            "url": f"http://fixture/{i}/{name}",
+            "body": body,
+            "not_modified": False,
+        })
+    return fetched
+
+def run(fetched, workers):
+    cutoff = parse.cutoff_time(datetime.now(timezone.utc))
+    started = time.perf_counter()
+    records = parse.parse_feeds(fetched, {}, cutoff, {}, workers=workers)
+    return time.perf_counter() - started, records
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse + normalize aşamasının çekirdek sayısıyla ölçeklenmesi")
+    parser.add_argument("--feeds", type=int, default=200, help="Simüle edilen feed sayısı")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    fetched = fixture_fetches(args.feeds)
+    entries = sum(body["body"].count(b"<item>") for body in fetched)
+    print(f"{args.feeds} feed, {entries} girdi, {os.cpu_count()} çekirdek")
+
+    counts = sorted({1, *[n for n in (2, 4, 8, 16, 32) if n <= args.max_workers], args.max_workers})
+    base_time, base_records = run(fetched, 1)
+    print(f"{'işçi':>5} {'süre':>9} {'girdi/s':>10} {'hızlanma':>9}")
+    print(f"{1:5d} {base_time:8.3f}s {entries / base_time:10.0f} {1.0:8.2f}x")
+
+    for workers in counts[1:]:
+        elapsed, records = run(fetched, workers)
+        # Çıktı sırası ve içeriği işçi sayısından bağımsız olmalı
+        assert records == base_records, f"{workers} işçiyle çıktı farklı"
+        print(f"{workers:5d} {elapsed:8.3f}s {entries / elapsed:10.0f} {base_time / elapsed:8.2f}x")
@@ -0,0 +1,301 @@
+import argparse
+import io
+import json
+import random
+import re
+import resource
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "news"))
+
+import feedparser  # noqa: E402
+from newsgen import classify, dedup, fetch, parse, text, translate  # noqa: E402
+from newsgen.jsonstream import write_articles  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+BASELINE = Path(__file__).resolve().parent / "bench_baseline.json"
+REGRESSION_RATIO = 1.25  # Baseline'a göre %25'ten fazla yavaşlama uyarı sayılır
+
+# fixtures/feeds/*.xml gerçek feed kaydı DEĞİL: kaynakların biçimini (CDATA, HTML özet,
+# enclosure / media:content, utm'li link) taklit eden, elle yazılmış sentetik feed'ler.
+# Linkler ve tarihler uydurma; tarihler çoğaltırken zaten güncellenir. Feed'ler arasında
+# ortak haber yok; çapraz feed tekrarı yalnızca --duplicates ile eklenir.
+# Sentetik feed -> generator'daki kaynak adı
+FIXTURE_SOURCES = {
+    "ntv.xml": "NTV",
+    "webtekno.xml": "Webtekno",
+    "bbc_world.xml": "BBC World",
+    "defense_news.xml": "Defense News",
+}
+
+ITEM_RE = re.compile(r"<item>.*?</item>", re.S)
+CDATA_RE = re.compile(r"(<(?:title|description)><!\[CDATA\[)(.*?)(\]\]>)", re.S)
+TAG_RE = re.compile(r"(<[^>]*>)")
+WORD_RE = re.compile(r"[^\W\d_]{4,}")
+MUTATION_RATE = 0.5  # Çoğaltılan kopyalarda değiştirilen kelime oranı (kopyalar birbirinin tekrarı olmasın)
+
+def text_parts(xml):
+    # Başlık / açıklama içindeki etiket dışı metin parçaları
+    for cdata in CDATA_RE.finditer(xml):
+        yield from TAG_RE.split(cdata.group(2))[::2]
+
+def mutate(text, rng, vocabulary):
+    # Etiket dışındaki kelimelerin bir kısmını sözlükten rastgele kelimelerle değiştir
+    parts = TAG_RE.split(text)
+    for i in range(0, len(parts), 2):
+        parts[i] = WORD_RE.sub(
+            lambda m: rng.choice(vocabulary) if rng.random() < MUTATION_RATE else m.group(0),
+            parts[i]
+        )
+    return "".join(parts)
+
+def scale_feed(xml, copies, rng, vocabulary):
+    # Feed'deki <item>'ları çoğalt: benzersiz guid/link, güncel tarih, yarısı değişmiş metin
+    items = ITEM_RE.findall(xml)
+    head = xml[:xml.index(items[0])]
+    tail = xml[xml.rindex(items[-1]) + len(items[-1]):]
+    now = datetime.now(timezone.utc)
+
+    scaled = []
+    for n in range(copies):
+        for i, item in enumerate(items):
+            k = n * len(items) + i
+            item = re.sub(r"(/haber/\d+)", rf"\1-{n}", item)
+            item = re.sub(
+                r"<pubDate>.*?</pubDate>",
+                f"<pubDate>{format_datetime(now - timedelta(seconds=k * 7))}</pubDate>",
+                item
+            )
+            if n:
+                item = CDATA_RE.sub(
+                    lambda m: m.group(1) + mutate(m.group(2), rng, vocabulary) + m.group(3),
+                    item
+                )
+            scaled.append(item)
+    return head, scaled, tail
+
+def add_duplicates(scaled, rate, rng):
+    # Çapraz feed tekrarı (aynı haberi iki kaynağın yayınlaması) yalnızca açıkça istenirse:
+    # her girdi `rate` olasılıkla aynı metin, farklı link ile başka bir feed'e de eklenir
+    names = sorted(scaled)
+    originals = {name: list(scaled[name][1]) for name in names}
+    for name in names:
+        for item in originals[name]:
+            if rng.random() >= rate:
+                continue
+            other = rng.choice([n for n in names if n != name])
+            site = re.search(r"<link>(https?://[^<]+?)/?</link>", scaled[other][0]).group(1)
+            prefix = f"{site}/haber/{Path(name).stem}-"
+            scaled[other][1].append(re.sub(r"https?://[^\s<\"?]+?/haber/", prefix, item))
+
+def load_fixture_feeds(total_entries, seed=1, duplicate_rate=0.0):
+    rng = random.Random(seed)
+    raw = {name: (FIXTURES / "feeds" / name).read_text(encoding="utf-8") for name in FIXTURE_SOURCES}
+    vocabulary = sorted({w for xml in raw.values() for part in text_parts(xml) for w in WORD_RE.findall(part)})
+    items = sum(len(ITEM_RE.findall(xml)) for xml in raw.values())
+    copies = max(1, total_entries // items)
+    scaled = {name: scale_feed(xml, copies, rng, vocabulary) for name, xml in raw.items()}
+    if duplicate_rate:
+        add_duplicates(scaled, duplicate_rate, rng)
+    return {
+        name: (head + "\n".join(body) + tail).encode("utf-8")
+        for name, (head, body, tail) in scaled.items()
+    }
+
+def fixture_images():
+    # /img/<ad> yanıtları: (gövde, Content-Type). missing.jpg bilerek yok (404).
+    # Pillow gerekir (görseller burada üretilir); check_images.py kullanır
+    from PIL import Image
+
+    def encode(size, color, fmt):
+        buf = io.BytesIO()
+        Image.new("RGB", size, color).save(buf, fmt)
+        return buf.getvalue()
+
+    return {
+        "good.jpg": (encode((1200, 800), (200, 60, 40), "JPEG"), "image/jpeg"),
+        "icon.png": (encode((48, 48), (20, 20, 20), "PNG"), "image/png"),
+        # Görsel yerine dönen giriş / hata sayfası
+        "page.jpg": (b"<!DOCTYPE html><html><body>Sign in</body></html>", "image/jpeg"),
+    }
+
+def start_fixture_server(feeds, translations=None, latency=0.0, images=None):
+    # GET /feeds/<ad> -> fixture feed, GET /img/<ad> -> fixture görsel, POST /translate -> LibreTranslate taklidi
+    # latency: çeviri isteği başına yapay gecikme (saniye; gerçek servis süresini taklit eder)
+    translations = translations or {}
+    images = images or {}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status, body, content_type):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            name = self.path.rsplit("/", 1)[-1]
+            if self.path.startswith("/img/"):
+                if name in images:
+                    self._send(200, *images[name])
+                else:
+                    self._send(404, b"", "text/plain")
+            elif name in feeds:
+                self._send(200, feeds[name], "application/rss+xml")
+            else:
+                self._send(404, b"", "text/plain")
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            if latency:
+                time.sleep(latency)
+            q = payload.get("q")
+            texts = q if isinstance(q, list) else [q]
+            out = [translations.get(t, f"[tr] {t}") for t in texts]
+            body = json.dumps(
+                {"translatedText": out if isinstance(q, list) else out[0]},
+                ensure_ascii=False
+            ).encode("utf-8")
+            self._send(200, body, "application/json")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def run_stage(results, name, fn, items, trace):
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    value = fn()
+    elapsed = time.perf_counter() - started
+    peak = None
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    results[name] = {
+        "seconds": round(elapsed, 4),
+        "items": items,
+        "per_second": round(items / elapsed, 1) if elapsed else None,
+        "peak_bytes": peak,
+    }
+    mem = f"  {peak / 1024 / 1024:7.1f} MB" if peak is not None else ""
+    print(f"{name:<14} {elapsed:8.3f}s  {items:7d}  {results[name]['per_second'] or 0:10.0f}/s{mem}")
+    return value
+
+def run_pipeline(total_entries, trace=False, duplicate_rate=0.0):
+    feeds = load_fixture_feeds(total_entries, duplicate_rate=duplicate_rate)
+    translations = json.loads((FIXTURES / "translations.json").read_text(encoding="utf-8"))
+    server, base_url = start_fixture_server(feeds, translations)
+
+    # Yerel çeviri sunucusunda gerçek servis hız sınırı ölçümü bozmasın
+    translate.TRANSLATE_URL = f"{base_url}/translate"
+    translate.TRANSLATE_RATE = 1000
+    translate.TRANSLATE_BURST = 1000
+
+    results = {}
+    local_feeds = [(FIXTURE_SOURCES[name], f"{base_url}/feeds/{name}") for name in feeds]
+
+    try:
+        fetched = run_stage(results, "fetch", lambda: fetch.fetch_all_feeds(local_feeds), len(local_feeds), trace)
+
+        parsed = run_stage(results, "parse", lambda: [
+            (f["source"], feedparser.parse(f["body"]).entries) for f in fetched
+        ], sum(body.count(b"<item>") for body in feeds.values()), trace)
+        entries = [(source, e) for source, feed_entries in parsed for e in feed_entries]
+        n = len(entries)
+
+        cleaned = run_stage(results, "clean_html", lambda: [
+            (source, text.clean_html(e.get("title", "")),
+             text.normalize_summary_html(e.get("summary") or "")[0])
+            for source, e in entries
+        ], n, trace)
+
+        # Kaynak override'ı atlanır: keyword sınıflandırması ölçülür
+        categories = run_stage(results, "classify", lambda: [
+            classify.determine_subcategory("", classify.determine_origin(source), title, summary)
+            for source, title, summary in cleaned
+        ], n, trace)
+
+        run_stage(results, "why_impacts", lambda: [
+            (classify.build_why_important(c), classify.build_possible_impacts(c))
+            for c in categories
+        ], n, trace)
+
+        articles = run_stage(results, "build_article", lambda: [
+            a for a in (parse.build_article(source, e) for source, e in entries) if a
+        ], n, trace)
+
+        for i, article in enumerate(articles):
+            article["entry_key"] = f"bench-{i}"
+        articles = run_stage(results, "dedup", lambda: dedup.dedupe_articles(articles), len(articles), trace)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = translate.TranslationCache(Path(tmp) / "cache.sqlite3")
+            texts = [
+                a[field]
+                for a in articles if a["origin"] == "yabanci"
+                for field in translate.TRANSLATED_FIELDS
+            ]
+            run_stage(results, "translate", lambda: translate.translate_texts(texts, cache), len(texts), trace)
+            cache.close()
+
+            out = Path(tmp) / "raw_news.json"
+            run_stage(results, "serialize", lambda: write_articles(out, articles), len(articles), trace)
+    finally:
+        server.shutdown()
+
+    return results
+
+def compare(results, baseline):
+    regressions = []
+    for name, current in results.items():
+        before = baseline.get("stages", {}).get(name)
+        if not before or not before["seconds"]:
+            continue
+        ratio = current["seconds"] / before["seconds"]
+        flag = "  <-- yavaşladı" if ratio > REGRESSION_RATIO else ""
+        print(f"{name:<14} {before['seconds']:8.3f}s -> {current['seconds']:8.3f}s  ({ratio:5.2f}x){flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sentetik fixture feed'lerle generator pipeline benchmark'ı")
+    parser.add_argument("--entries", type=int, default=5000, help="Toplam feed girdisi (yaklaşık)")
+    parser.add_argument("--duplicates", type=float, default=0.0, help="Başka bir feed'de de yayınlanan girdi oranı (dedup yükü için, örn. 0.1)")
+    parser.add_argument("--tracemalloc", action="store_true", help="Aşama başına Python bellek zirvesi (süreleri yavaşlatır)")
+    parser.add_argument("--save-baseline", action="store_true", help="Sonucu baseline olarak kaydet")
+    parser.add_argument("--check", action="store_true", help="Baseline'a göre yavaşlama varsa hata kodu dön")
+    args = parser.parse_args()
+
+    print(f"{'aşama':<14} {'süre':>9}  {'adet':>7}  {'hız':>12}")
+    results = run_pipeline(args.entries, trace=args.tracemalloc, duplicate_rate=args.duplicates)
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"toplam {sum(r['seconds'] for r in results.values()):.3f}s, en yüksek RSS {max_rss:.1f} MB")
+
+    report = {"entries": args.entries, "duplicates": args.duplicates, "max_rss_mb": round(max_rss, 1), "stages": results}
+    regressions = []
+    if BASELINE.exists() and not args.save_baseline:
+        print("\nbaseline karşılaştırması:")
+        regressions = compare(results, json.loads(BASELINE.read_text(encoding="utf-8")))
+
+    if args.save_baseline:
+        BASELINE.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline kaydedildi: {BASELINE}")
+
+    if args.check and regressions:
+        sys.exit(1)
@@ -0,0 +1,67 @@
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "news"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import feedparser  # noqa: E402
+from bench_pipeline import FIXTURES, load_fixture_feeds, start_fixture_server  # noqa: E402
+from newsgen import text, translate  # noqa: E402
+
+def fixture_texts(total_entries):
+    # Sentetik fixture feed'lerdeki başlık + özetler (çevrilecek metinlerin örneği)
+    texts = []
+    for body in load_fixture_feeds(total_entries).values():
+        for e in feedparser.parse(body).entries:
+            texts.append(text.clean_html(e.get("title", "")))
+            texts.append(text.normalize_summary_html(e.get("summary") or "")[0])
+    return [t for t in dict.fromkeys(texts) if translate.needs_translation(t)]
+
+def make_translator(name, url):
+    if name == "libretranslate":
+        # Genel servisin hız sınırı ve batch boyutu aynen korunur
+        return translate.HTTPTranslator(url=url)
+    if name == "local":
+        return translate.LocalServerTranslator(url=url)
+    # get_translator'ın genel servise düşme davranışı burada istenmez: kurulamazsa atla
+    return translate.TRANSLATORS[name]()
+
+def bench(name, translator, texts):
+    # Boş cache ile: her metin backend'e gider
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = translate.TranslationCache(Path(tmp) / "cache.sqlite3")
+        started = time.perf_counter()
+        result = translate.translate_texts(texts, cache, translator)
+        elapsed = time.perf_counter() - started
+        cache.close()
+    print(
+        f"{name:<16} {elapsed:8.2f}s  {len(result):6d}/{len(texts)}  "
+        f"{len(result) / elapsed:8.1f} metin/s"
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Çeviri backend'lerinin fixture feed metinleriyle hızı")
+    parser.add_argument("--entries", type=int, default=400, help="Toplam feed girdisi (yaklaşık)")
+    parser.add_argument("--latency", type=float, default=0.3, help="HTTP backend'lerde istek başına yapay gecikme (s)")
+    parser.add_argument("--backends", default="libretranslate,local,argos", help="Virgülle ayrılmış backend listesi")
+    args = parser.parse_args()
+
+    texts = fixture_texts(args.entries)
+    translations = json.loads((FIXTURES / "translations.json").read_text(encoding="utf-8"))
+    server, base_url = start_fixture_server({}, translations, latency=args.latency)
+    print(f"{len(texts)} metin, HTTP gecikmesi {args.latency}s/istek")
+
+    try:
+        for name in args.backends.split(","):
+            try:
+                translator = make_translator(name, f"{base_url}/translate")
+            except (ImportError, RuntimeError) as exc:
+                print(f"{name:<16} atlandı: {exc}")
+                continue
+            bench(name, translator, texts)
+    finally:
+        server.shutdown()
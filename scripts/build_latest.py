@@ -1,38 +1,317 @@
+import gzip
+import hashlib
+import heapq
 import json
+import os
+import sys
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "news"))
+
+from newsgen.incremental import article_id as stable_id  # noqa: E402
+from newsgen.jsonstream import iter_articles, write_articles  # noqa: E402
+
+try:
+    import brotli
+except ImportError:  # brotli opsiyonel; yoksa sadece .gz üretilir
+    brotli = None
+
 RAW = Path("news/raw_news.json")
 OUT = Path("news/latest.json")
 
 MAX_ARTICLES = 50  # Performans limiti
+MAX_PER_CATEGORY = None  # Örn. 10: tek kategori listeyi dolduramaz
+SHARD_DIR = Path("news/cat")
+MANIFEST = Path("news/manifest.json")
+PAGE_SIZE = 50  # Shard sayfası başına haber
+DELTA_DIR = Path("news")
+DELTA_HEAD = Path("news/delta-head.json")
+DELTA_KEEP = 48  # Saklanan en eski delta (saatlik çalışmada ~2 gün)
+ARTICLE_DIR = Path("news/a")  # Haber başına news/a/<id>.json (reader.html için)
+ARTICLE_INDEX = ARTICLE_DIR / "index.json"
+
+TRANSLATED_FIELDS = ("title", "summary", "long_summary")
+
+def trim_article(article):
+    # Türkçe kaynaklarda *_tr alanları orijinalin kopyası; istemci zaten orijinale düşüyor
+    trimmed = dict(article)
+    for field in TRANSLATED_FIELDS:
+        if trimmed.get(f"{field}_tr") == trimmed.get(field):
+            trimmed.pop(f"{field}_tr", None)
+    return trimmed
+
+def write_precompressed(path):
+    # Statik sunucuların (gzip_static / brotli_static) doğrudan sunabileceği kardeş dosyalar
+    data = Path(path).read_bytes()
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    Path(f"{path}.gz").write_bytes(compressed)
+    sizes = {"gz": len(compressed)}
+    if brotli is not None:
+        compressed = brotli.compress(data, quality=11)
+        Path(f"{path}.br").write_bytes(compressed)
+        sizes["br"] = len(compressed)
+    return sizes
+
+def size_report(label, articles, trimmed, path, compressed):
+    # Her adımın boyut katkısını göster
+    meta = {"updated_at": None}
+    pretty = len(json.dumps({**meta, "articles": articles}, ensure_ascii=False, indent=2).encode("utf-8"))
+    minified = len(json.dumps({**meta, "articles": articles}, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    steps = [
+        ("indent=2", pretty),
+        ("minified", minified),
+        ("-*_tr", len(json.dumps({**meta, "articles": trimmed}, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))),
+        ("dosya", Path(path).stat().st_size),
+    ]
+    steps += [(f".{ext}", size) for ext, size in compressed.items()]
+    print(f"[{label}] " + "  ".join(f"{name}: {size / 1024:.1f} KB" for name, size in steps))
+
+def published_epoch(item):
+    # ISO 8601 ve RFC 822 tarihlerini epoch saniyeye çevir; okunamazsa 0
+    value = item.get("published_at")
+    if not value:
+        return 0
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return 0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+def select_latest(articles, k, per_category=None):
+    # Tarihler bir kez parse edilir; seçim O(n log k)
+    keyed = ((published_epoch(a), -i, a) for i, a in enumerate(articles))
+
+    if not per_category:
+        return [a for _, _, a in heapq.nlargest(k, keyed, key=lambda x: x[:2])]
+
+    # Kategori başına en fazla `per_category` haberlik min-heap'ler
+    heaps = {}
+    for epoch, order, article in keyed:
+        heap = heaps.setdefault(article.get("category_slug") or "", [])
+        item = (epoch, order, id(article), article)
+        if len(heap) < per_category:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+    candidates = (item for heap in heaps.values() for item in heap)
+    return [item[3] for item in heapq.nlargest(k, candidates, key=lambda x: x[:2])]
+
+def shard_filters(articles):
+    # index.html'deki filtrelerle aynı kurallar: (kategori, kaynak) -> koşul
+    slugs = sorted({a.get("category_slug") for a in articles if a.get("category_slug")})
+    categories = {"all": lambda a: True, "yerel": lambda a: a.get("is_local") is True}
+    for slug in slugs:
+        categories.setdefault(slug, lambda a, slug=slug: a.get("category_slug") == slug)
+    origins = {
+        "all": lambda a: True,
+        "tr": lambda a: a.get("origin") == "turkiye",
+        "intl": lambda a: a.get("origin") != "turkiye",
+    }
+    for cat, cat_match in categories.items():
+        for origin, origin_match in origins.items():
+            yield cat, origin, lambda a, c=cat_match, o=origin_match: c(a) and o(a)
+
+def write_shards(articles, updated_at, seq, precompress=False):
+    # Her (kategori, kaynak) için sayfalı, içerik hash'li dosyalar + küçük bir manifest
+    # Dönüş: id -> haberin kendi kategorisindeki shard sayfası
+    shards = {}
+    written = set()
+    pages_by_id = {}
+
+    for cat, origin, match in shard_filters(articles):
+        selected = [a for a in articles if match(a)]
+        if not selected:
+            continue
+        pages = []
+        for start in range(0, len(selected), PAGE_SIZE):
+            body = json.dumps(
+                {"articles": selected[start:start + PAGE_SIZE]},
+                ensure_ascii=False,
+                separators=(",", ":")
+            )
+            digest = hashlib.sha1(body.encode("utf-8")).hexdigest()[:10]
+            page = SHARD_DIR / cat / origin / f"page-{start // PAGE_SIZE + 1}.{digest}.json"
+            if not page.exists():
+                page.parent.mkdir(parents=True, exist_ok=True)
+                page.write_text(body, encoding="utf-8")
+                if precompress:
+                    write_precompressed(page)
+            written.add(page)
+            pages.append(page.as_posix())
+            if origin == "all" and cat not in ("all", "yerel"):
+                for a in selected[start:start + PAGE_SIZE]:
+                    pages_by_id[a["id"]] = page.as_posix()
+        shards[f"{cat}/{origin}"] = {"count": len(selected), "pages": pages}
+
+    # Artık manifest'te olmayan eski shard dosyalarını temizle
+    if SHARD_DIR.exists():
+        for old in SHARD_DIR.rglob("*.json*"):
+            page = old.with_suffix("") if old.suffix in (".gz", ".br") else old
+            if page not in written:
+                old.unlink()
+
+    tmp = MANIFEST.with_name(MANIFEST.name + ".tmp")
+    tmp.write_text(
+        json.dumps({"updated_at": updated_at, "seq": seq, "shards": shards}, ensure_ascii=False, separators=(",", ":")),
+        encoding="utf-8"
+    )
+    os.replace(tmp, MANIFEST)
+    return pages_by_id
+
+def article_id(article):
+    # Generator'ın kalıcı id'si; eski raw_news kayıtlarında entry_key / URL / başlıktan türetilir
+    if article.get("id"):
+        return article["id"]
+    return stable_id(article.get("entry_key") or article.get("url") or article.get("title") or "")
+
+def collect_ids(articles, ids):
+    # Akan haberlerin id'lerini toplarken aynen ilet (raw_news ikinci kez okunmaz)
+    for article in articles:
+        ids.add(article_id(article))
+        yield article
+
+def write_article_files(articles, keep_ids):
+    # Değişen haber dosyalarını yaz; raw_news'ta artık olmayanları sil (paylaşılan linkler 36 saat yaşar)
+    ARTICLE_DIR.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for article in articles:
+        body = json.dumps(article, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        path = ARTICLE_DIR / f"{article['id']}.json"
+        if not path.exists() or path.read_bytes() != body:
+            path.write_bytes(body)
+            written += 1
+
+    keep = keep_ids | {a["id"] for a in articles}
+    removed = 0
+    for old in ARTICLE_DIR.glob("*.json"):
+        if old != ARTICLE_INDEX and old.stem not in keep:
+            old.unlink()
+            removed += 1
+    print(f"[news/a] {written} yazıldı, {removed} silindi")
 
-with open(RAW, "r", encoding="utf-8") as f:
-    raw = json.load(f)
-
-articles = raw.get("articles", [])
-
-def sort_key(item):
-    # ISO tarih string’i varsa onu kullan
-    return item.get("published_at") or ""
-
-# 🔽 EN YENİ HABERLER ÜSTTE (STRING SORT)
-articles = sorted(
-    articles,
-    key=sort_key,
-    reverse=True
-)
-
-# 🔽 SADECE İLK 50 HABER
-articles = articles[:MAX_ARTICLES]
-
-OUT.parent.mkdir(exist_ok=True)
-with open(OUT, "w", encoding="utf-8") as f:
-    json.dump(
-        {
-            "updated_at": raw.get("generated_at"),
-            "articles": articles
-        },
-        f,
-        ensure_ascii=False,
-        indent=2
+def write_article_index(pages_by_id, updated_at, seq):
+    tmp = ARTICLE_INDEX.with_name(ARTICLE_INDEX.name + ".tmp")
+    tmp.write_text(
+        json.dumps({"updated_at": updated_at, "seq": seq, "articles": pages_by_id}, separators=(",", ":")),
+        encoding="utf-8"
     )
+    os.replace(tmp, ARTICLE_INDEX)
+
+def load_delta_head():
+    if DELTA_HEAD.exists():
+        try:
+            return json.loads(DELTA_HEAD.read_text(encoding="utf-8"))
+        except ValueError:
+            pass
+    return {"seq": 0}
+
+def write_delta(seq, added, removed, updated, updated_at):
+    # Sadece eklenen / çıkarılan / yerinde güncellenen haberleri içeren küçük değişiklik dosyası + işaretçi
+    # (updated: id'si aynı kalıp gövdesi değişenler — geç çeviri, fulltext, thumbnail)
+    delta = DELTA_DIR / f"delta-{seq}.json"
+    delta.write_text(
+        json.dumps({
+            "seq": seq,
+            "prev_seq": seq - 1,
+            "updated_at": updated_at,
+            "added": added,
+            "removed": removed,
+            "updated": updated
+        }, ensure_ascii=False, separators=(",", ":")),
+        encoding="utf-8"
+    )
+
+    oldest = max(1, seq - DELTA_KEEP + 1)
+    for old in DELTA_DIR.glob("delta-*.json"):
+        suffix = old.stem[len("delta-"):]
+        if suffix.isdigit() and int(suffix) < oldest:
+            old.unlink()
+
+    tmp = DELTA_HEAD.with_name(DELTA_HEAD.name + ".tmp")
+    tmp.write_text(
+        json.dumps({"seq": seq, "oldest_seq": oldest, "updated_at": updated_at}, separators=(",", ":")),
+        encoding="utf-8"
+    )
+    os.replace(tmp, DELTA_HEAD)
+
+def main(argv=None):
+    # --pretty: girintili JSON (varsayılan minified); --precompress: .gz / .br kardeş dosyaları da yaz.
+    # Bayraklar çağrı anında okunur: daemon main()'i kendi argv'siyle tekrar tekrar çağırır
+    argv = sys.argv[1:] if argv is None else argv
+    pretty = "--pretty" in argv
+    precompress = "--precompress" in argv
+
+    # 🔽 Önceki build (id'ler, sıra numaraları ve içerik karşılaştırması için)
+    previous = list(iter_articles(OUT)) if OUT.exists() else []
+    previous_by_id = {a["id"]: a for a in previous if a.get("id")}
+
+    # 🔽 Haberler dosyadan tek tek okunur; bellekte en fazla K haber tutulur
+    raw_meta = {}
+
+    # 🔽 EN YENİ HABERLER ÜSTTE (GERÇEK TARİH SIRASI), SADECE İLK 50 HABER
+    raw_ids = set()
+    articles = select_latest(
+        collect_ids(iter_articles(RAW, raw_meta), raw_ids),
+        MAX_ARTICLES,
+        per_category=MAX_PER_CATEGORY
+    )
+
+    head = load_delta_head()
+    seq = head["seq"] + 1
+
+    trimmed = []
+    for article in articles:
+        item = trim_article(article)
+        item["id"] = article_id(article)
+        item["seq"] = previous_by_id.get(item["id"], {}).get("seq", seq)
+        trimmed.append(item)
+
+    current_ids = {a["id"] for a in trimmed}
+    added = [a for a in trimmed if a["id"] not in previous_by_id]
+    removed = [i for i in previous_by_id if i not in current_ids]
+    updated = [
+        a for a in trimmed
+        if a["id"] in previous_by_id and a != previous_by_id[a["id"]]
+    ]
+
+    # 🔽 Haber başına küçük dosyalar (reader.html tüm listeyi indirmez)
+    write_article_files(trimmed, raw_ids)
+
+    # 🔽 Hiçbir şey değişmediyse dosyalara dokunma (gereksiz git commit'i olmasın)
+    if not added and not removed and trimmed == previous:
+        print(f"[latest.json] değişiklik yok (seq {head['seq']})")
+        return
+
+    updated_at = raw_meta.get("generated_at")
+    write_articles(
+        OUT,
+        trimmed,
+        meta={"updated_at": updated_at, "seq": seq},
+        pretty=pretty
+    )
+    if precompress:
+        compressed = write_precompressed(OUT)
+    else:
+        # Önceki --precompress çalışmasından kalan kardeşler latest.json'dan geri kalmasın
+        compressed = {}
+        for ext in ("gz", "br"):
+            Path(f"{OUT}.{ext}").unlink(missing_ok=True)
+    size_report("latest.json", articles, trimmed, OUT, compressed)
+
+    write_delta(seq, added, removed, updated, updated_at)
+    print(f"[delta] seq {seq}: +{len(added)} / -{len(removed)} / ~{len(updated)}")
+
+    # 🔽 Kategori / kaynak bazlı shard'lar (index.html yalnızca ihtiyacı olanı indirir)
+    pages_by_id = write_shards(trimmed, updated_at, seq, precompress)
+    write_article_index(pages_by_id, updated_at, seq)
+
+if __name__ == "__main__":
+    main()
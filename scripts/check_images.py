@@ -0,0 +1,78 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "news"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_pipeline import fixture_images, start_fixture_server  # noqa: E402
+from newsgen import images, runstats  # noqa: E402
+
+# Görsel aşamasını fixture sunucusuna karşı çalıştırır: doğru aday seçiliyor mu,
+# kırık adaylar eleniyor mu, ikinci turda küçük kopya yeniden kullanılıyor mu.
+# Pillow gerekir. Çıktı geçici dizine yazılır (news/img dokunulmaz).
+
+def fresh_articles(base):
+    return [
+        # İkon feed'de önce gelse de geniş görsel seçilmeli
+        {"id": "good", "image": None, "image_candidates": [
+            {"url": f"{base}/img/icon.png"},
+            {"url": f"{base}/img/good.jpg"},
+        ]},
+        # 404 + görsel diye dönen HTML: hiçbiri kullanılmamalı
+        {"id": "broken", "image": f"{base}/img/missing.jpg", "image_candidates": [
+            {"url": f"{base}/img/missing.jpg"},
+            {"url": f"{base}/img/page.jpg"},
+        ]},
+        # Tek aday ikonsa yine de o seçilir
+        {"id": "icon", "image": None, "image_candidates": [
+            {"url": f"{base}/img/icon.png"},
+        ]},
+    ]
+
+def run(base):
+    runstats.reset()
+    articles = fresh_articles(base)
+    images.process_images(articles, articles)
+    return {a["id"]: a for a in articles}, runstats.snapshot()["counters"]
+
+def check(base):
+    failures = []
+
+    def expect(ok, message):
+        if not ok:
+            failures.append(message)
+
+    first, counters = run(base)
+    expect(first["good"]["image"] == f"{base}/img/good.jpg", f"good: {first['good']['image']}")
+    expect(first["broken"]["image"] is None, f"broken: {first['broken']['image']}")
+    expect(first["icon"]["image"] == f"{base}/img/icon.png", f"icon: {first['icon']['image']}")
+    expect(first["good"].get("thumb"), "good: küçük kopya yok")
+    expect(counters.get("images.thumb_created") == 2, f"ilk tur sayaçları: {counters}")
+    files = sorted(images.THUMB_DIR.glob("*.webp"))
+
+    second, counters = run(base)
+    expect(second["good"].get("thumb") == first["good"].get("thumb"), "good: küçük kopya değişti")
+    expect(counters.get("images.thumb_cached") == 2, f"ikinci tur sayaçları: {counters}")
+    expect(not counters.get("images.thumb_created"), f"ikinci turda yeni küçük kopya: {counters}")
+    expect(sorted(images.THUMB_DIR.glob("*.webp")) == files, "küçük kopya dosyaları değişti")
+    return failures
+
+if __name__ == "__main__":
+    if not images.has_pillow():
+        sys.exit("Pillow kurulu değil")
+    server, base = start_fixture_server({}, images=fixture_images())
+    cwd = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                failures = check(base)
+            finally:
+                os.chdir(cwd)
+    finally:
+        server.shutdown()
+    if failures:
+        sys.exit("\n".join(failures))
+    print("görsel seçimi ve küçük kopya önbelleği: OK")